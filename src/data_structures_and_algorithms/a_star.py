@@ -0,0 +1,109 @@
+"""
+A* search algorithm.
+
+Dijkstra's algorithm guided towards the destination by a heuristic h(node)
+estimating the remaining distance to dest: the priority queue is ordered by
+dist + h instead of dist.
+
+If h is admissible (never overestimates the remaining distance), the first time
+dest is popped its distance is the shortest one. With h = 0, it is Dijkstra.
+
+Use cases:
+- Point-to-point shortest path in grid and geometric graphs (e.g. maps) where the
+    straight line distance is a lower bound of the path length.
+
+Algorithm:
+- Initialize dist (inf) and prev arrays (-1)
+- Priority queue of (dist + h, dist, node)
+- Pop a node, skip it if it is outdated (its dist decreased since it was pushed)
+    - Break when dest is found
+    - Iterate on neighbors if there distance would decrease
+        - Update their distance and prev, and push them with their heuristic
+- Reconstruct the path with prev (and reverse it)
+
+Complexity: V nodes and E edges
+- Same as Dijkstra in the worst case: O(E log V)
+- But with a good heuristic, far fewer nodes are settled (the search goes straight to dest)
+
+Tips:
+- Admissible: h(node) <= true distance to dest, otherwise the path may not be the shortest
+- Consistent (or monotone): h(u) <= w(u, v) + h(v), then nodes are settled once like in Dijkstra
+    - Euclidean and Manhattan distances are consistent if the weights are at least
+        the distance between the coordinates of the nodes
+- Without consistency, a node can be settled again when a shorter path is found
+    -> check for outdated entries with dist instead of a visited array
+- Manhattan is admissible only for grid moves (no diagonals)
+"""
+
+import math
+from collections.abc import Callable, Iterable, Sequence
+from heapq import heappop, heappush
+
+from data_structures_and_algorithms.dijkstra import INF, reconstruct_path
+from data_structures_and_algorithms.graph import CSRGraph, as_csr
+
+type Heuristic = Callable[[int], float]
+
+
+def a_star(
+    n: int,
+    edges: Iterable[tuple[int, int, float]] | CSRGraph,
+    src: int,
+    dest: int,
+    heuristic: Heuristic | Sequence[Sequence[float]],
+) -> list[int] | None:
+    """
+    Return the shortest path from src to dest in the graph or None if no path exists.
+
+    The heuristic is either a callable returning a lower bound of the distance from
+    a node to dest, or the coordinates of each node, which gives the euclidean
+    distance heuristic (see `manhattan_heuristic` for grids).
+    """
+    # Edges cases
+    if n == 0:
+        return None
+    h = heuristic if callable(heuristic) else euclidean_heuristic(heuristic, dest)
+
+    # Adjacency in CSR format
+    graph = as_csr(n, edges)
+    offsets, neighbors, weights = graph.offsets, graph.targets, graph.weights
+
+    # BFS with priority queue ordered by dist + h
+    pq: list[tuple[float, float, int]] = [(h(src), 0, src)]  # estimate, dist, node
+    dist = [INF] * n
+    dist[src] = 0
+    prev = [-1] * n
+
+    while pq:
+        _, node_dist, node = heappop(pq)
+        # Base case
+        if node_dist > dist[node]:  # outdated
+            continue
+        if node == dest:
+            break
+
+        # Iteration
+        for k in range(offsets[node], offsets[node + 1]):
+            neib = neighbors[k]
+            neib_dist = weights[k] + node_dist
+            if neib_dist >= dist[neib]:
+                continue
+            dist[neib] = neib_dist
+            prev[neib] = node
+            heappush(pq, (neib_dist + h(neib), neib_dist, neib))
+    else:
+        return None
+
+    return reconstruct_path(prev, dest)
+
+
+def euclidean_heuristic(coords: Sequence[Sequence[float]], dest: int) -> Heuristic:
+    """Return the straight line distance heuristic to dest from the coordinates of the nodes."""
+    target = coords[dest]
+    return lambda node: math.dist(coords[node], target)
+
+
+def manhattan_heuristic(coords: Sequence[Sequence[float]], dest: int) -> Heuristic:
+    """Return the Manhattan distance heuristic to dest from the coordinates of the nodes."""
+    target = coords[dest]
+    return lambda node: sum(abs(x - y) for x, y in zip(coords[node], target, strict=True))
@@ -0,0 +1,182 @@
+"""
+All-pairs shortest paths with a process pool.
+
+Run one Dijkstra per source, the sources being spread over a pool of processes.
+Each search is independent, so it scales with the number of cores.
+
+The graph is written once to a CSR file that every worker memory maps (see
+`CSRGraph.save`/`CSRGraph.load`): workers share the same pages instead of
+receiving a pickled copy of the graph with each task.
+
+Use cases:
+- Distance matrices (clustering, routing tables, facility location...) on graphs
+    with non-negative weights
+
+Algorithm:
+- Save the graph to a temporary file, start the workers with an initializer loading it
+- Split the sources in chunks (one task per chunk to amortize the inter-process overhead)
+- Each task runs dijkstra_all for each of its sources and either:
+    - sends the distance rows back (compact arrays of floats), streamed as tasks complete
+    - or writes them directly into a memory mapped V x V matrix file
+
+Complexity: V nodes and E edges
+- O(V * E log V) work, divided by the number of workers
+- Memory: O(V + E) per worker (shared pages), plus the rows in flight
+
+Tips:
+- Initialize the workers once (initializer) instead of passing the graph to each task
+- The matrix file is written with a shared memory map (MAP_SHARED): rows written by
+    the workers end up in the same file without going through the parent process
+"""
+
+from __future__ import annotations
+
+import mmap
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from data_structures_and_algorithms.dijkstra import Queue, dijkstra_all
+from data_structures_and_algorithms.graph import CSRGraph, as_csr
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+DEFAULT_CHUNK_SIZE = 16
+
+# Worker state, set once per process by the initializer
+_graph: CSRGraph | None = None
+_matrix: memoryview[float] | None = None
+
+
+def all_pairs_shortest_paths(
+    n: int,
+    edges: Iterable[tuple[int, int, float]] | CSRGraph,
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    queue: Queue = "auto",
+) -> Iterator[tuple[int, array[float]]]:
+    """
+    Yield the (src, dist) distance row of every source, in completion order.
+
+    dist[v] is the length of the shortest path from src to v, infinite if v is
+    unreachable. The rows are computed in a pool of max_workers processes.
+    """
+    yield from _run_pool(as_csr(n, edges), _rows, max_workers, chunk_size, queue)
+
+
+def all_pairs_shortest_path_trees(
+    n: int,
+    edges: Iterable[tuple[int, int, float]] | CSRGraph,
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    queue: Queue = "auto",
+) -> Iterator[tuple[int, array[float], array[int]]]:
+    """
+    Yield the (src, dist, prev) shortest path tree of every source, in completion order.
+
+    Same as `all_pairs_shortest_paths` with the prev row of each source, to
+    reconstruct the paths with `dijkstra.reconstruct_path`.
+    """
+    yield from _run_pool(as_csr(n, edges), _trees, max_workers, chunk_size, queue)
+
+
+def write_distance_matrix(
+    n: int,
+    edges: Iterable[tuple[int, int, float]] | CSRGraph,
+    path: str | Path,
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    queue: Queue = "auto",
+) -> None:
+    """
+    Write the V x V distance matrix of the graph to a file.
+
+    The matrix is stored row-major as native float64 values, e.g. readable with
+    `numpy.memmap(path, dtype=numpy.float64, shape=(n, n))`. The workers write their
+    rows directly into the memory mapped file.
+    """
+    graph = as_csr(n, edges)
+    with Path(path).open("wb") as f:
+        f.truncate(8 * n * n)
+    if n == 0:
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        graph_path = Path(tmp_dir) / "graph.csr"
+        graph.save(graph_path)
+
+        with ProcessPoolExecutor(
+            max_workers, initializer=_init_worker, initargs=(graph_path, Path(path))
+        ) as executor:
+            futures = [
+                executor.submit(_write_rows, range(start, min(start + chunk_size, n)), queue)
+                for start in range(0, n, chunk_size)
+            ]
+            for future in as_completed(futures):
+                future.result()  # Raise the errors of the workers
+
+
+def _run_pool[T](
+    graph: CSRGraph,
+    task: Callable[[range, Queue], list[T]],
+    max_workers: int | None,
+    chunk_size: int,
+    queue: Queue,
+) -> Iterator[T]:
+    """Yield the results of the task on chunks of sources, run in a pool sharing the graph."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        graph_path = Path(tmp_dir) / "graph.csr"
+        graph.save(graph_path)
+
+        with ProcessPoolExecutor(
+            max_workers, initializer=_init_worker, initargs=(graph_path, None)
+        ) as executor:
+            futures = [
+                executor.submit(task, range(start, min(start + chunk_size, graph.n)), queue)
+                for start in range(0, graph.n, chunk_size)
+            ]
+            for future in as_completed(futures):
+                yield from future.result()
+
+
+def _init_worker(graph_path: Path, matrix_path: Path | None) -> None:
+    """Memory map the graph (and the output matrix) once per worker process."""
+    global _graph, _matrix  # noqa: PLW0603
+    _graph = CSRGraph.load(graph_path)
+    if matrix_path is not None:
+        with matrix_path.open("r+b") as f:
+            _matrix = memoryview(mmap.mmap(f.fileno(), 0)).cast("d")
+
+
+def _rows(sources: range, queue: Queue) -> list[tuple[int, array[float]]]:
+    """Return the distance rows of the sources."""
+    assert _graph is not None
+    return [
+        (src, array("d", dijkstra_all(_graph.n, _graph, src, queue=queue)[0])) for src in sources
+    ]
+
+
+def _trees(sources: range, queue: Queue) -> list[tuple[int, array[float], array[int]]]:
+    """Return the distance and prev rows of the sources."""
+    assert _graph is not None
+    trees = []
+    for src in sources:
+        dist, prev = dijkstra_all(_graph.n, _graph, src, queue=queue)
+        trees.append((src, array("d", dist), array("q", prev)))
+    return trees
+
+
+def _write_rows(sources: range, queue: Queue) -> None:
+    """Write the distance rows of the sources into the matrix."""
+    assert _graph is not None
+    assert _matrix is not None
+    n = _graph.n
+    for src in sources:
+        dist, _ = dijkstra_all(n, _graph, src, queue=queue)
+        _matrix[src * n : (src + 1) * n] = array("d", dist)
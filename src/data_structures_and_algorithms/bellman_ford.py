@@ -16,6 +16,13 @@ A second optimization is to relax only vertices whose distance value changed
 since the last time  their edges have been relaxed, by keeping a collection of
 vertices whose edges should be relaxed, removing a vertex when its edges are
 relaxed, and adding it when its distance value changes.
+This is the Shortest Path Faster Algorithm (SPFA, see `spfa`), where the
+collection is a FIFO queue with an "in queue" flag per vertex. Negative cycles
+are detected by counting the edges of the current path to each vertex: a
+shortest path has at most |V| - 1 edges.
+SPFA heuristics reorder the queue to relax small distances first:
+- Small Label First (SLF): push at the front if lower than the front distance
+- Large Label Last (LLL): move the front to the back while it is above the average distance
 
 Use cases:
 - Shortest path in graph with negative edges, and therefore potentially negative cycles.
@@ -26,23 +33,41 @@ Algorithm:
 Complexity: V nodes and E edges
     - O(V * E): E edges relaxed V - 1 times
     - with optimization: O(E * l) where l is the length of the maximum length of a shortest path
+    - SPFA: same worst case, O(E) on average on random graphs
+- DAG (detect_dag): O(V + E), each edge relaxed once in topological order (see `dag_shortest_path`)
 
 Tips:
 - We don't need adjacency list or matrix, the list of edges is enough
+    - A prebuilt CSRGraph can be passed directly since it iterates over its (u, v, w) edges
 - To detect negative cycles, check for an edge where dist[u] + w < dist[v]: it can only exist if there is a negative cycle and the edge is reachable from the cycle
     - Go backward predecessors keeping track of visited nodes until you visit a node twice. This node is on the cycle.
     - Then you can reconstruct the cycle.
 """
 
+from collections import deque
 from collections.abc import Iterable
 
+from data_structures_and_algorithms.dag_shortest_path import dag_shortest_paths
+from data_structures_and_algorithms.graph import CSRGraph, as_csr
+
 INF = float("inf")
 
 
 def bellman_ford(
-    n: int, edges: Iterable[tuple[int, int, float]], src: int
+    n: int,
+    edges: Iterable[tuple[int, int, float]] | CSRGraph,
+    src: int,
+    *,
+    detect_dag: bool = False,
 ) -> tuple[list[float], list[int]] | None:
-    """Return the shortest path from the source to all nodes in the graph or None if a negative cycle is detected."""
+    """
+    Return the shortest path from the source to all nodes in the graph or None if a negative cycle is detected.
+
+    With detect_dag, acyclic graphs are solved in O(V + E) by `dag_shortest_paths`.
+    """
+    if detect_dag and (result := dag_shortest_paths(n, edges, src)) is not None:
+        return result
+
     predecessors = [-1] * n
     dist = [INF] * n
     dist[src] = 0
@@ -64,9 +89,16 @@ def bellman_ford(
 
 
 def bellman_ford_opti(
-    n: int, edges: Iterable[tuple[int, int, float]], src: int
+    n: int,
+    edges: Iterable[tuple[int, int, float]] | CSRGraph,
+    src: int,
+    *,
+    detect_dag: bool = False,
 ) -> tuple[list[float], list[int]] | tuple[None, list[int]]:
-    """Return shortest paths or a detected negative cycle."""
+    """Return shortest paths or a detected negative cycle, see `bellman_ford` for detect_dag."""
+    if detect_dag and (result := dag_shortest_paths(n, edges, src)) is not None:
+        return result
+
     predecessors = [-1] * n
     dist = [INF] * n
     dist[src] = 0
@@ -88,23 +120,113 @@ def bellman_ford_opti(
         if dist[u] + w < dist[v]:
             # v is reachable from a negative cycle
             predecessors[v] = u
+            cycle = _find_cycle(predecessors, v)
+            if cycle is not None:
+                return None, cycle
+
+    return dist, predecessors
+
 
-            # Find the cycle
-            visited = [False] * n
-            visited[v] = True
+def spfa(
+    n: int,
+    edges: Iterable[tuple[int, int, float]] | CSRGraph,
+    src: int,
+    *,
+    slf: bool = False,
+    lll: bool = False,
+) -> tuple[list[float], list[int]] | tuple[None, list[int]]:
+    """
+    Return shortest paths or a detected negative cycle, like `bellman_ford_opti`.
+
+    Shortest Path Faster Algorithm: only the out edges of the nodes whose distance
+    changed are relaxed, using a FIFO queue of nodes. Optional heuristics:
+    - slf (Small Label First): push a node at the front if its distance is lower than the front's
+    - lll (Large Label Last): move front nodes to the back while their distance is above the average
+    """
+    graph = as_csr(n, edges)
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    predecessors = [-1] * n
+    dist = [INF] * n
+    dist[src] = 0
+    path_edges = [0] * n  # number of edges of the current path to each node
+    in_queue = bytearray(n)
+
+    q = deque([src])
+    in_queue[src] = 1
+    total = 0  # sum of the distances in the queue, for lll
+
+    while q:
+        if lll:
+            _large_label_last(q, dist, total)
+        u = q.popleft()
+        in_queue[u] = 0
+        total -= dist[u]
+
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            new_dist = dist[u] + weights[k]
+            if new_dist >= dist[v]:
+                continue
+            if in_queue[v]:
+                total += new_dist - dist[v]
+            dist[v] = new_dist
+            predecessors[v] = u
 
-            current = u
-            while not visited[current]:
-                visited[current] = True
-                current = predecessors[current]
-            # node is now a vertex in a negative cycle
-            cycle_node = current
-            cycle = [cycle_node]
-            while predecessors[current] != cycle_node:
-                current = predecessors[current]
-                cycle.append(current)
-            cycle.reverse()
+            # A shortest path has at most n - 1 edges, so v is reachable from a negative cycle
+            path_edges[v] = path_edges[u] + 1
+            if path_edges[v] >= n:
+                return None, _spfa_cycle(graph, src, predecessors, v)
 
-            return None, cycle
+            if not in_queue[v]:
+                in_queue[v] = 1
+                total += new_dist
+                _push(q, v, dist, slf=slf)
 
     return dist, predecessors
+
+
+def _large_label_last(q: deque[int], dist: list[float], total: float) -> None:
+    """Move the front nodes to the back while their distance is above the average of the queue."""
+    # Rotate at most once over the queue: rounding errors could put every node above
+    average = total / len(q)
+    for _ in range(len(q)):
+        if dist[q[0]] <= average:
+            return
+        q.rotate(-1)
+
+
+def _push(q: deque[int], v: int, dist: list[float], *, slf: bool) -> None:
+    """Push v at the back of the queue, or at the front if slf and its distance is below the front's."""
+    if slf and q and dist[v] < dist[q[0]]:
+        q.appendleft(v)
+    else:
+        q.append(v)
+
+
+def _spfa_cycle(graph: CSRGraph, src: int, predecessors: list[int], v: int) -> list[int]:
+    """Return a negative cycle reaching v, found in the predecessors or by `bellman_ford_opti`."""
+    cycle = _find_cycle(predecessors, v)
+    if cycle is None:  # Rare: the predecessors don't contain the cycle yet
+        _, cycle = bellman_ford_opti(graph.n, graph, src)
+    return cycle
+
+
+def _find_cycle(predecessors: list[int], start: int) -> list[int] | None:
+    """Return the cycle found walking the predecessors backward from start, if any."""
+    visited = [False] * len(predecessors)
+    current = start
+    while current != -1 and not visited[current]:
+        visited[current] = True
+        current = predecessors[current]
+    if current == -1:
+        return None
+
+    # current is now a vertex in a negative cycle
+    cycle_node = current
+    cycle = [cycle_node]
+    while predecessors[current] != cycle_node:
+        current = predecessors[current]
+        cycle.append(current)
+    cycle.reverse()
+
+    return cycle
@@ -0,0 +1,133 @@
+"""
+Vectorized Bellman-Ford's algorithm with NumPy.
+
+Same algorithm as `bellman_ford.bellman_ford_opti`, but each pass relaxes all the
+edges at once with array operations instead of one Python tuple at a time:
+V * E interpreter iterations become V vectorized passes over E.
+
+Requires the `numpy` extra.
+
+Algorithm:
+- Store the edges as 3 arrays u, v, w
+- Each pass (synchronous relaxation, from the distances of the previous pass):
+    - Only keep the edges whose source changed during the last pass
+    - Gather: candidates = dist[u] + w
+    - Scatter: np.minimum.at(dist, v, candidates), the minimum of the candidates of each node
+    - Predecessors: the source of an edge whose candidate is the new distance of its target
+    - Stop early if no distance changed
+- If distances still change at pass V, there is a negative cycle: walk the
+    predecessors backward from a changed node to find it
+
+Complexity: V nodes and E edges
+- O(V * E) operations, but vectorized
+- Synchronous passes: after pass k, dist[v] is the shortest walk with at most k edges
+
+Tips:
+- np.minimum.at is unbuffered, so repeated targets are all taken into account
+    (dist[v] = np.minimum(dist[v], c) would keep only one candidate per target)
+- inf + w stays inf, so unreachable sources never relax anything
+- Walking V steps backward from a node updated at pass V lands on a cycle
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from data_structures_and_algorithms.bellman_ford import bellman_ford_opti
+from data_structures_and_algorithms.graph import CSRGraph
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class EdgeArrays(NamedTuple):
+    """Edges stored as 3 arrays of sources, targets and weights."""
+
+    u: npt.NDArray[np.int64]
+    v: npt.NDArray[np.int64]
+    w: npt.NDArray[np.float64]
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[int, int, float]] | CSRGraph) -> EdgeArrays:
+        """Return the edge arrays, sharing the buffers of a CSR graph without copying them."""
+        if isinstance(edges, CSRGraph):
+            return cls(
+                np.asarray(edges.sources, dtype=np.int64),
+                np.asarray(edges.targets, dtype=np.int64),
+                np.asarray(edges.weights, dtype=np.float64),
+            )
+        arr = np.array(list(edges), dtype=np.float64).reshape(-1, 3)
+        return cls(arr[:, 0].astype(np.int64), arr[:, 1].astype(np.int64), arr[:, 2])
+
+
+def bellman_ford_numpy(
+    n: int, edges: Iterable[tuple[int, int, float]] | CSRGraph | EdgeArrays, src: int
+) -> tuple[list[float], list[int]] | tuple[None, list[int]]:
+    """Return shortest paths or a detected negative cycle, like `bellman_ford_opti`."""
+    if not isinstance(edges, EdgeArrays):
+        edges = EdgeArrays.from_edges(edges)
+    u, v, w = edges
+
+    dist = np.full(n, np.inf)
+    dist[src] = 0
+    predecessors = np.full(n, -1, dtype=np.int64)
+    changed = np.zeros(n, dtype=bool)
+    changed[src] = True
+
+    # Relax the edges n - 1 times, and once more to detect negative cycles
+    for _ in range(n):
+        changed = _relax(dist, predecessors, changed, u, v, w)
+        if not changed.any():
+            return dist.tolist(), predecessors.tolist()
+
+    # Negative cycle: walk back from a node that still changed
+    node = int(np.flatnonzero(changed)[0])
+    for _ in range(n):
+        node = int(predecessors[node])
+        if node == -1:
+            # The predecessors don't contain the cycle (not expected): fallback
+            _, cycle = bellman_ford_opti(
+                n, zip(u.tolist(), v.tolist(), w.tolist(), strict=True), src
+            )
+            return None, cycle
+
+    cycle = [node]
+    current = int(predecessors[node])
+    while current != node:
+        cycle.append(current)
+        current = int(predecessors[current])
+    cycle.reverse()
+
+    return None, cycle
+
+
+def _relax(
+    dist: npt.NDArray[np.float64],
+    predecessors: npt.NDArray[np.int64],
+    changed: npt.NDArray[np.bool_],
+    u: npt.NDArray[np.int64],
+    v: npt.NDArray[np.int64],
+    w: npt.NDArray[np.float64],
+) -> npt.NDArray[np.bool_]:
+    """Relax the out edges of the changed nodes in place and return the nodes that changed."""
+    active = changed[u]
+    u, v, w = u[active], v[active], w[active]
+
+    # Gather the candidates of the edges improving their target
+    candidates = dist[u] + w
+    improving = candidates < dist[v]
+    u, v, candidates = u[improving], v[improving], candidates[improving]
+
+    # Scatter the minimum candidate of each target
+    new_changed = np.zeros_like(changed)
+    new_changed[v] = True
+    np.minimum.at(dist, v, candidates)
+
+    # Predecessors: any edge achieving the new distance
+    best = candidates == dist[v]
+    predecessors[v[best]] = u[best]
+
+    return new_changed
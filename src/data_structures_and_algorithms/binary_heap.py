@@ -19,6 +19,12 @@ Operations:
 - Push: O(log(n))
 
 
+Indexed heap (for decrease key, e.g. in Dijkstra):
+- Items are 0 to n - 1, with keys[item] and pos[item] (index in the heap or -1) in flat arrays
+- Decrease key: update keys[item] and bubble up from pos[item] in O(log(n))
+- The heap holds each item at most once -> size <= n instead of one entry per push
+- Keys only need to be comparable: tuples like (weight, index) break ties consistently
+
 Tips:
 - parent(i) = (i - 1) // 2 -> max(0, (i - 1))
 - children(i) = (i * 2 + 1, i * 2 + 2) + BOUNDS
@@ -26,6 +32,7 @@ Tips:
 - pop and heapify down only if non empty
     - when heapifying down, don't, remember to check for bounds -> bounds in _children function
 - Heapify: heapify down i for i in reversed(range(n // 2))
+- Indexed heap: update pos for every item moved (move a "hole" instead of swapping)
 
 [1 2 3 4 5]
 1
@@ -35,6 +42,15 @@ Tips:
 
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, overload
+
+if TYPE_CHECKING:
+    from _typeshed import SupportsDunderLT
+
+INF = float("inf")
+
 
 class MinHeap:
     """Min heap."""
@@ -88,10 +104,94 @@ class MinHeap:
         return lchild if lchild < n else i, rchild if rchild < n else i
 
 
-h = MinHeap()
-h.push(3)
-h.push(1)
-h.push(2)
-print(h.pop())
+class IndexedMinHeap[K: SupportsDunderLT[Any]]:
+    """
+    Min heap of the items 0 to n - 1 with a decrease key operation.
+
+    The key of each item and its position in the heap are stored in flat arrays,
+    so the heap holds each item at most once and a key can be updated in place.
+    Keys are floats initialized to inf, or any comparable type with its own
+    initial (greatest) key.
+    """
+
+    @overload
+    def __init__(self: IndexedMinHeap[float], n: int) -> None: ...
+    @overload
+    def __init__(self, n: int, inf: K) -> None: ...
+    def __init__(self, n: int, inf: Any = INF) -> None:
+        self.heap: list[int] = []  # items
+        self.pos: list[int] = [-1] * n  # position of each item in the heap, -1 if absent
+        self.keys: list[K] = [inf] * n  # key of each item
+
+    def push(self, item: int, key: K) -> None:
+        """Push item with the given key into the heap."""
+        self.keys[item] = key
+        self.heap.append(item)
+        self.pos[item] = len(self.heap) - 1
+        self._heapify_up(len(self.heap) - 1)
+
+    def decrease_key(self, item: int, key: K) -> None:
+        """Lower the key of an item of the heap."""
+        self.keys[item] = key
+        self._heapify_up(self.pos[item])
+
+    def pop(self) -> int:
+        """Pop and return the item with the minimum key (its key stays in keys)."""
+        item = self.heap[0]
+        last = self.heap.pop()
+        self.pos[item] = -1
+        if self.heap:
+            self.heap[0] = last
+            self.pos[last] = 0
+            self._heapify_down(0)
+        return item
+
+    def __contains__(self, item: int) -> bool:
+        return self.pos[item] != -1
 
-h = MinHeap([3, 2, 6, 7, 9, 1])
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def _heapify_up(self, i: int) -> None:
+        # Move the hole up instead of swapping
+        heap, pos, keys = self.heap, self.pos, self.keys
+        item = heap[i]
+        key = keys[item]
+        while i > 0:
+            par_i = (i - 1) // 2
+            parent = heap[par_i]
+            if not key < keys[parent]:
+                break
+            heap[i] = parent
+            pos[parent] = i
+            i = par_i
+        heap[i] = item
+        pos[item] = i
+
+    def _heapify_down(self, i: int) -> None:
+        heap, pos, keys = self.heap, self.pos, self.keys
+        n = len(heap)
+        item = heap[i]
+        key = keys[item]
+        child = 2 * i + 1
+        while child < n:
+            if child + 1 < n and keys[heap[child + 1]] < keys[heap[child]]:
+                child += 1
+            if not keys[heap[child]] < key:
+                break
+            heap[i] = heap[child]
+            pos[heap[i]] = i
+            i = child
+            child = 2 * i + 1
+        heap[i] = item
+        pos[item] = i
+
+
+if __name__ == "__main__":
+    h = MinHeap()
+    h.push(3)
+    h.push(1)
+    h.push(2)
+    print(h.pop())
+
+    h = MinHeap([3, 2, 6, 7, 9, 1])
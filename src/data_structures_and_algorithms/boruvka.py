@@ -0,0 +1,119 @@
+"""
+Borůvka's algorithm, vectorized with NumPy.
+
+Return the edges forming a minimum spanning tree (forest) of a graph, like
+`kruskal.kruskal`, but by rounds: each round adds the cheapest outgoing edge of
+every component at once and contracts them, which maps to whole-array operations.
+
+Requires the `numpy` extra.
+
+Use cases:
+- Minimum spanning trees of large graphs, where each round is a few vectorized
+    passes over the edge arrays instead of one Python iteration per edge
+
+Algorithm:
+- Sort the edges by weight once: the position of an edge is a unique key, which
+    breaks ties consistently (no cycle between equal weights)
+- Each round:
+    - Drop the edges inside a component (comp[u] == comp[v])
+    - Cheapest edge of each component: np.minimum.at of the edge positions on
+        comp[u] and comp[v]
+    - Add the selected edges to the tree
+    - Contract: each component points to the component on the other side of its
+        edge, mutual pairs keep the lowest label as root, then pointer jumping
+        (ptr = ptr[ptr]) until every component points to its root
+- Stop when no edge links 2 components
+
+Complexity: V nodes and E edges
+- O(log V) rounds: the number of components at least halves at each round
+- O(E) vectorized work per round, O(E log V) in total (+ O(E log E) for the sort)
+
+Tips:
+- With unique keys, the cheapest edges only form cycles of length 2 (both
+    components selected the same edge): break them by keeping the lowest label
+- Edges inside a component stay inside it: filter them out for good
+- Same tree as Kruskal with a stable sort (same tie breaking), returned in the same order
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from data_structures_and_algorithms.bellman_ford_numpy import EdgeArrays
+from data_structures_and_algorithms.graph import CSRGraph
+
+
+def boruvka[T: int | float](
+    n: int, edges: list[tuple[int, int, T]] | CSRGraph
+) -> list[tuple[int, int, T]]:
+    """
+    Return the edges of a minimum spanning tree, like `kruskal.kruskal`.
+
+    Edges are given as:  (u, v, w), where w is the weight, or as a prebuilt
+    CSRGraph whose directed edges are considered undirected.
+    """
+    u, v, w = EdgeArrays.from_edges(edges)
+    order = np.argsort(w, kind="stable")
+    u, v = u[order], v[order]
+    positions = np.arange(len(order))  # Position of the remaining edges in the sorted order
+
+    comp = np.arange(n)
+    selected = []
+
+    while True:
+        # Drop the edges inside a component
+        cu, cv = comp[u], comp[v]
+        outgoing = cu != cv
+        u, v, positions = u[outgoing], v[outgoing], positions[outgoing]
+        cu, cv = cu[outgoing], cv[outgoing]
+        if not len(positions):
+            break
+
+        has_edge, edge = _cheapest_edges(n, cu, cv)
+        selected.append(positions[np.unique(edge)])
+
+        # Contract: point to the other side, break the mutual pairs, then jump
+        other = np.where(cu[edge] == has_edge, cv[edge], cu[edge])
+        comp = _roots(n, has_edge, other)[comp]
+
+    tree_positions = np.sort(np.concatenate(selected)) if selected else np.empty(0, np.int64)
+    return _original_edges(edges, order[tree_positions].tolist())
+
+
+def _cheapest_edges(
+    n: int, cu: npt.NDArray[np.int64], cv: npt.NDArray[np.int64]
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Return the components with an outgoing edge and the index of their cheapest (first) one."""
+    m = len(cu)
+    cheapest = np.full(n, m)
+    indices = np.arange(m)
+    np.minimum.at(cheapest, cu, indices)
+    np.minimum.at(cheapest, cv, indices)
+    has_edge = np.flatnonzero(cheapest < m)
+    return has_edge, cheapest[has_edge]
+
+
+def _roots(
+    n: int, components: npt.NDArray[np.int64], others: npt.NDArray[np.int64]
+) -> npt.NDArray[np.int64]:
+    """Return the root of each component label once each component is merged with its other side."""
+    labels = np.arange(n)
+    ptr = labels.copy()
+    ptr[components] = others
+    mutual_roots = (ptr[ptr] == labels) & (labels < ptr)
+    ptr[mutual_roots] = labels[mutual_roots]
+    while not np.array_equal(jumped := ptr[ptr], ptr):
+        ptr = jumped
+    return ptr
+
+
+def _original_edges[T: int | float](
+    edges: Iterable[tuple[int, int, T]] | CSRGraph, indices: list[int]
+) -> list[tuple[int, int, T]]:
+    """Return the edges at the given indices, with their original weight type."""
+    if isinstance(edges, CSRGraph):
+        sources, targets, weights = edges.sources, edges.targets, edges.weights
+        return [(sources[k], targets[k], weights[k]) for k in indices]  # pyright: ignore[reportReturnType]
+    edges = edges if isinstance(edges, list) else list(edges)
+    return [edges[k] for k in indices]
@@ -0,0 +1,158 @@
+"""
+DAG task executor driven by Khan's algorithm.
+
+Run a DAG of tasks (e.g. build or ETL steps) concurrently: a task is dispatched
+as soon as all its dependencies are done, that is as soon as its in degree drops
+to 0 in Khan's algorithm, instead of running a precomputed order serially.
+
+Use cases:
+- Build systems, data pipelines, any set of jobs with dependencies, on a
+    thread pool (I/O bound), a process pool (CPU bound) or an asyncio loop
+
+Algorithm:
+- Count the incoming degree of each task, the tasks with in degree 0 are ready
+- While tasks are ready or running:
+    - Submit ready tasks while fewer than max_in_flight tasks are running
+    - Wait for the first task to complete
+        - Success: decrement the in degree of its successors, the ones reaching 0 are ready
+        - Failure (or cancellation): cancel all its descendants (DFS), they will never be ready
+
+Complexity: V tasks and E dependencies
+- O(V + E) scheduling work on top of the tasks themselves
+
+Tips:
+- Check that the graph is acyclic before running anything (tasks of a cycle would never be ready)
+- max_in_flight < 1 would never submit anything: reject it upfront
+- A cancelled task can still reach in degree 0 through its other dependencies:
+    check the cancelled set before making it ready
+- Tasks of a ProcessPoolExecutor must be picklable (module level functions, functools.partial...)
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, CancelledError, Executor, Future, wait
+from typing import NamedTuple
+
+from data_structures_and_algorithms.graph import CSRGraph, as_csr
+from data_structures_and_algorithms.khan import khan_layers
+
+
+class DagRun[T](NamedTuple):
+    """Outcome of the tasks of a DAG run, by task index."""
+
+    results: dict[int, T]  # Return value of each successful task
+    errors: dict[int, BaseException]  # Exception of each failed (or cancelled) task
+    cancelled: set[int]  # Descendants of failed tasks, never run
+
+
+def run_dag[T](
+    tasks: Sequence[Callable[[], T]],
+    edges: Iterable[tuple[int, int]] | CSRGraph,
+    executor: Executor,
+    *,
+    max_in_flight: int | None = None,
+) -> DagRun[T]:
+    """
+    Run the tasks on the executor, each one as soon as its dependencies succeeded.
+
+    An edge (u, v) means that task v depends on task u. At most max_in_flight tasks
+    are submitted at a time (no limit if None). Raise ValueError if there is a cycle
+    or if max_in_flight < 1.
+    """
+    _check_max_in_flight(max_in_flight)
+    scheduler = _Scheduler[T](len(tasks), edges)
+    running: dict[Future[T], int] = {}
+
+    while scheduler.ready or running:
+        while scheduler.ready and (max_in_flight is None or len(running) < max_in_flight):
+            node = scheduler.ready.popleft()
+            running[executor.submit(tasks[node])] = node
+
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            node = running.pop(future)
+            if future.cancelled():
+                scheduler.fail(node, CancelledError())
+            elif (error := future.exception()) is not None:
+                scheduler.fail(node, error)
+            else:
+                scheduler.succeed(node, future.result())
+
+    return scheduler.run
+
+
+async def run_dag_async[T](
+    tasks: Sequence[Callable[[], Awaitable[T]]],
+    edges: Iterable[tuple[int, int]] | CSRGraph,
+    *,
+    max_in_flight: int | None = None,
+) -> DagRun[T]:
+    """Run the coroutine functions on the running event loop, like `run_dag`."""
+    _check_max_in_flight(max_in_flight)
+    scheduler = _Scheduler[T](len(tasks), edges)
+    running: dict[asyncio.Task[T], int] = {}
+
+    while scheduler.ready or running:
+        while scheduler.ready and (max_in_flight is None or len(running) < max_in_flight):
+            node = scheduler.ready.popleft()
+            running[asyncio.ensure_future(tasks[node]())] = node
+
+        done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            node = running.pop(task)
+            if task.cancelled():
+                scheduler.fail(node, asyncio.CancelledError())
+            elif (error := task.exception()) is not None:
+                scheduler.fail(node, error)
+            else:
+                scheduler.succeed(node, task.result())
+
+    return scheduler.run
+
+
+def _check_max_in_flight(max_in_flight: int | None) -> None:
+    """Raise ValueError if max_in_flight would never let a task be submitted."""
+    if max_in_flight is not None and max_in_flight < 1:
+        msg = f"max_in_flight must be at least 1, got {max_in_flight}"
+        raise ValueError(msg)
+
+
+class _Scheduler[T]:
+    """In degree bookkeeping of Khan's algorithm, with the outcome of the tasks."""
+
+    def __init__(self, n: int, edges: Iterable[tuple[int, int]] | CSRGraph) -> None:
+        self.graph: CSRGraph = as_csr(n, edges)
+        if khan_layers(n, self.graph) is None:
+            msg = "The task graph has a cycle"
+            raise ValueError(msg)
+
+        self.in_degrees: list[int] = [0] * n
+        for v in self.graph.targets:
+            self.in_degrees[v] += 1
+        self.ready: deque[int] = deque(
+            node for node, degree in enumerate(self.in_degrees) if degree == 0
+        )
+        self.run: DagRun[T] = DagRun({}, {}, set())
+
+    def succeed(self, node: int, result: T) -> None:
+        """Record the result and make the successors without remaining dependencies ready."""
+        self.run.results[node] = result
+        offsets, targets = self.graph.offsets, self.graph.targets
+        for neib in targets[offsets[node] : offsets[node + 1]]:
+            self.in_degrees[neib] -= 1
+            if self.in_degrees[neib] == 0 and neib not in self.run.cancelled:
+                self.ready.append(neib)
+
+    def fail(self, node: int, error: BaseException) -> None:
+        """Record the error and cancel all the descendants of the node."""
+        self.run.errors[node] = error
+        offsets, targets = self.graph.offsets, self.graph.targets
+        cancelled = self.run.cancelled
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for neib in targets[offsets[current] : offsets[current + 1]]:
+                if neib not in cancelled:
+                    cancelled.add(neib)
+                    stack.append(neib)
@@ -0,0 +1,110 @@
+"""
+Shortest and longest paths in a Directed Acyclic Graph (DAG).
+
+Without cycles, a topological order gives an order in which every edge can be
+relaxed exactly once: when a node is reached, all the paths to it have already
+been relaxed.
+
+Use cases:
+- Shortest paths with negative edges in a DAG, in O(V + E) instead of Bellman-Ford's O(V * E)
+- Longest paths (NP-hard in general graphs, linear in DAGs)
+- Critical path of a schedule (build pipelines, project planning): the longest
+    chain of dependencies, which bounds the total duration
+
+Algorithm:
+- Topological order with Khan's algorithm, by layers (no order: the graph has a cycle)
+- Initialize dist (inf, or -inf for longest paths) and prev arrays (-1)
+- For each node u in topological order, relax its out edges (u, v, w)
+- Critical path: same with every node as a source (dist 0), then walk back prev
+    from the node with the largest distance
+
+Complexity: V nodes and E edges
+- O(V + E): one topological sort, then each edge relaxed once
+
+Tips:
+- Longest paths are shortest paths with negated weights: no need for another loop
+- Skip the nodes that are not reachable yet (infinite distance), they can't relax anything
+"""
+
+from collections.abc import Iterable
+
+from data_structures_and_algorithms.dijkstra import reconstruct_path
+from data_structures_and_algorithms.graph import CSRGraph, as_csr
+from data_structures_and_algorithms.khan import khan_layers
+
+INF = float("inf")
+
+
+def dag_shortest_paths(
+    n: int,
+    edges: Iterable[tuple[int, int, float]] | CSRGraph,
+    src: int,
+    *,
+    longest: bool = False,
+) -> tuple[list[float], list[int]] | None:
+    """
+    Return the shortest (or longest) paths from the source to all nodes, or None if the graph has a cycle.
+
+    Unreachable nodes have an infinite distance (-inf for longest paths).
+    """
+    graph = as_csr(n, edges)
+    order = _topological_order(graph)
+    if order is None:
+        return None
+
+    # Longest paths: shortest paths with negated weights
+    sign = -1 if longest else 1
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    dist = [INF] * n
+    dist[src] = 0
+    prev = [-1] * n
+
+    for u in order:
+        d = dist[u]
+        if d == INF:
+            continue
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            new_dist = d + sign * weights[i]
+            if new_dist < dist[v]:
+                dist[v] = new_dist
+                prev[v] = u
+
+    return [sign * d for d in dist], prev
+
+
+def critical_path(
+    n: int, edges: Iterable[tuple[int, int, float]] | CSRGraph
+) -> tuple[float, list[int]] | None:
+    """Return the length and nodes of the longest path of the graph, or None if the graph has a cycle."""
+    graph = as_csr(n, edges)
+    order = _topological_order(graph)
+    if order is None:
+        return None
+    if n == 0:
+        return 0, []
+
+    # Every node starts a path of length 0
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    dist: list[float] = [0] * n
+    prev = [-1] * n
+
+    for u in order:
+        d = dist[u]
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            new_dist = d + weights[i]
+            if new_dist > dist[v]:
+                dist[v] = new_dist
+                prev[v] = u
+
+    end = max(range(n), key=dist.__getitem__)
+    return dist[end], reconstruct_path(prev, end)
+
+
+def _topological_order(graph: CSRGraph) -> list[int] | None:
+    """Return the BFS order of Khan's algorithm (the layers one after the other), or None on a cycle."""
+    layers = khan_layers(graph.n, graph)
+    if layers is None:
+        return None
+    return [node for layer in layers for node in layer]
@@ -0,0 +1,222 @@
+"""
+Delta-stepping.
+
+Single-source shortest paths with non-negative edges, like Dijkstra, but settling
+whole buckets of nodes at once instead of one node at a time: the relaxations of
+a bucket are independent and can be spread over several processes.
+
+Use cases:
+- A single shortest path query on a very large graph, using more than one core
+- With max_workers=1, a bucket-based alternative to Dijkstra (no heap of nodes)
+
+Algorithm:
+- Bucket i holds the nodes with a tentative distance in [i * delta, (i + 1) * delta)
+- Light edges have a weight <= delta, heavy edges a weight > delta
+- Take the first non-empty bucket i:
+    - While bucket i is not empty: empty it into the settled set R and relax the
+        light edges of its nodes (they can reinsert nodes into bucket i)
+    - Relax the heavy edges of R once (they can only reach later buckets)
+- Relaxing v with a shorter distance moves it to the bucket of the new distance
+- Parallel: the relaxation requests (v, dist[u] + w, u) of the nodes of a bucket
+    are computed in shards by a process pool sharing the memory mapped CSR graph,
+    then applied by the main process
+
+Complexity: V nodes, E edges, L the maximum shortest path length, d the maximum degree
+- delta = inf: Bellman-Ford like, delta -> 0: Dijkstra like
+- O(V + E + L / delta + ...) phases, O(V + E) work on average for random weights
+    with delta = Θ(1/d)
+
+Tips:
+- The default delta is max weight / average degree: larger buckets give more
+    parallel work but more re-relaxations
+- Only shard big buckets: sending the nodes to the workers and the requests back
+    costs more than relaxing a small bucket in place
+- Requests are reduced to the minimum per target in each shard before being sent back
+"""
+
+import tempfile
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from heapq import heappop, heappush
+from pathlib import Path
+
+from data_structures_and_algorithms.dijkstra import INF, reconstruct_path
+from data_structures_and_algorithms.graph import CSRGraph, as_csr
+
+DEFAULT_SHARD_SIZE = 1024  # Nodes per task, smaller buckets are relaxed by the main process
+
+type _Requests = list[tuple[int, float, int]]  # (node, new distance, predecessor)
+
+# Worker state, set once per process by the initializer
+_graph: CSRGraph | None = None
+
+
+def delta_stepping(  # noqa: PLR0913
+    n: int,
+    edges: Iterable[tuple[int, int, float]] | CSRGraph,
+    src: int,
+    dest: int,
+    *,
+    delta: float | None = None,
+    max_workers: int | None = 1,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> list[int] | None:
+    """Return the shortest path from src to dest in the graph or None if no path exists, like `dijkstra`."""
+    if n == 0:
+        return None
+
+    dist, prev = delta_stepping_all(
+        n, edges, src, delta=delta, max_workers=max_workers, shard_size=shard_size
+    )
+    if dist[dest] == INF:
+        return None
+
+    return reconstruct_path(prev, dest)
+
+
+def delta_stepping_all(
+    n: int,
+    edges: Iterable[tuple[int, int, float]] | CSRGraph,
+    src: int,
+    *,
+    delta: float | None = None,
+    max_workers: int | None = 1,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> tuple[list[float], list[int]]:
+    """
+    Return the dist and prev arrays of the shortest path tree from src, like `dijkstra_all`.
+
+    The relaxations of buckets larger than shard_size nodes are spread over a pool
+    of max_workers processes (max_workers=1: no pool).
+    """
+    graph = as_csr(n, edges)
+    if graph.weights and min(graph.weights) < 0:
+        msg = "Delta-stepping doesn't support negative weights"
+        raise ValueError(msg)
+    if delta is None:
+        delta = default_delta(graph)
+
+    def local_requests(nodes: list[int], dists: list[float], light: bool) -> _Requests:
+        return _requests(graph, nodes, dists, delta, light)
+
+    if max_workers == 1:
+        return _delta_stepping(graph, src, delta, local_requests)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        graph_path = Path(tmp_dir) / "graph.csr"
+        graph.save(graph_path)
+
+        with ProcessPoolExecutor(
+            max_workers, initializer=_init_worker, initargs=(graph_path,)
+        ) as executor:
+
+            def sharded_requests(nodes: list[int], dists: list[float], light: bool) -> _Requests:
+                if len(nodes) <= shard_size:
+                    return local_requests(nodes, dists, light)
+                return _sharded_requests(executor, nodes, dists, delta, light, shard_size)
+
+            return _delta_stepping(graph, src, delta, sharded_requests)
+
+
+def default_delta(graph: CSRGraph) -> float:
+    """Return the bucket width: maximum weight divided by the average degree."""
+    if not graph.weights or graph.n == 0:
+        return 1
+    max_weight = max(graph.weights)
+    if max_weight == 0:
+        return 1
+    return max_weight / max(1, graph.num_edges / graph.n)
+
+
+def _delta_stepping(
+    graph: CSRGraph,
+    src: int,
+    delta: float,
+    requests: Callable[[list[int], list[float], bool], _Requests],
+) -> tuple[list[float], list[int]]:
+    """Run delta-stepping, computing the relaxation requests of the buckets with requests."""
+    dist = [INF] * graph.n
+    prev = [-1] * graph.n
+    buckets: dict[int, set[int]] = {}
+    indices: list[int] = []  # Heap of bucket indices, possibly outdated
+
+    def relax(v: int, new_dist: float, u: int) -> None:
+        old_dist = dist[v]
+        if new_dist >= old_dist:
+            return
+        if old_dist != INF and (old_bucket := buckets.get(int(old_dist // delta))) is not None:
+            old_bucket.discard(v)
+        dist[v] = new_dist
+        prev[v] = u
+        i = int(new_dist // delta)
+        if i not in buckets:
+            buckets[i] = set()
+            heappush(indices, i)
+        buckets[i].add(v)
+
+    relax(src, 0, -1)
+    while indices:
+        i = heappop(indices)
+        settled: set[int] = set()
+
+        # Light edges, until bucket i stays empty
+        while bucket := buckets.pop(i, None):
+            settled |= bucket
+            nodes = list(bucket)
+            for v, new_dist, u in requests(nodes, [dist[u] for u in nodes], True):
+                relax(v, new_dist, u)
+
+        # Heavy edges, once
+        nodes = list(settled)
+        for v, new_dist, u in requests(nodes, [dist[u] for u in nodes], False):
+            relax(v, new_dist, u)
+
+    return dist, prev
+
+
+def _requests(
+    graph: CSRGraph, nodes: list[int], dists: list[float], delta: float, light: bool
+) -> _Requests:
+    """Return the best relaxation request per target of the light (or heavy) edges of the nodes."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    best: dict[int, tuple[float, int]] = {}
+    for u, d in zip(nodes, dists, strict=True):
+        for i in range(offsets[u], offsets[u + 1]):
+            w = weights[i]
+            if (w <= delta) != light:
+                continue
+            v = targets[i]
+            new_dist = d + w
+            if v not in best or new_dist < best[v][0]:
+                best[v] = (new_dist, u)
+    return [(v, new_dist, u) for v, (new_dist, u) in best.items()]
+
+
+def _sharded_requests(
+    executor: Executor,
+    nodes: list[int],
+    dists: list[float],
+    delta: float,
+    light: bool,
+    shard_size: int,
+) -> _Requests:
+    """Return the relaxation requests of the nodes, computed in shards by the workers."""
+    futures = [
+        executor.submit(
+            _shard_requests, nodes[i : i + shard_size], dists[i : i + shard_size], delta, light
+        )
+        for i in range(0, len(nodes), shard_size)
+    ]
+    return [request for future in futures for request in future.result()]
+
+
+def _init_worker(graph_path: Path) -> None:
+    """Memory map the graph once per worker process."""
+    global _graph  # noqa: PLW0603
+    _graph = CSRGraph.load(graph_path)
+
+
+def _shard_requests(nodes: list[int], dists: list[float], delta: float, light: bool) -> _Requests:
+    """Return the relaxation requests of a shard of nodes."""
+    assert _graph is not None
+    return _requests(_graph, nodes, dists, delta, light)
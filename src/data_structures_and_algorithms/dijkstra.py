@@ -7,13 +7,16 @@ non-negative edges.
 
 Use cases:
 - Shortest path to every node or a single node in weighted graph with no negative edges.
+- One-to-many: one search for several destinations, stopping when all of them are settled.
+- Implicit graphs (grids, state spaces...) too large to build: `dijkstra_implicit`
+    takes a neighbors callback and only stores the explored nodes in dicts.
 
 Algorithm:
 - Initialize dist (inf) and prev arrays (-1)
 - Like breadth first search but with a priority queue containing the shortest length of the path to the current node passing by the previous node.
 - When a node is visited, its distance is the shortest path from the source to the node.
     - Update prev
-    - Break when dest is found
+    - Break when dest is found (or all the targets, nothing to break on for one-to-all)
     - Iterate on neighbors if there distance would decrease
         - Update their distance in the loop
 - Reconstruct the path with prev (and reverse it)
@@ -22,58 +25,355 @@ Complexity: V nodes and E edges
 - O(E log E) ~ O(E log V)
     - Each edge can be taken at most once
     - Push and pop cost of the priority queue for each (at most E edges in the priority queue)
+- With an indexed heap (decrease key): O(E log V) with at most V nodes in the priority queue
+- Integer weights <= C with Dial's buckets: O(E + V * C), no comparisons
+    (one step per distance up to the largest one, up to (V - 1) * C on a long path)
+- Integer weights with a radix heap: O(E + V log C)
+- 0/1 weights with a deque (0-1 BFS): O(V + E)
+
+Bidirectional variant (point-to-point):
+- Run a forward search from src and a backward search from dest on the reversed graph,
+    always expanding the side whose queue has the smallest top.
+- On each relaxation of (u, v), v may connect both searches: keep the best
+    dist_f[u] + w + dist_b[v] and the meeting node.
+- Stop when top_f + top_b >= best: no path through unsettled nodes can be shorter.
+- The path is prev_f from src to the meeting node, then prev_b from the meeting node to dest.
+- Same worst case, but each search only explores a "ball" of about half the radius,
+    which settles far fewer nodes on large sparse (e.g. road) graphs.
 
 Tips:
-- In base case, check prev to see if the node is visited and update prev
+- In base case, check if the node is visited and update prev
+    - prev can't be used as the visited marker since the source has no predecessor
 - In loop, check new neighbor distance and update and push if lower to avoid useless push cost
 - Remember to reverse the path at the end
+- Keep dist and prev to reconstruct the paths of many destinations lazily
 - We need to check visited twice (in base case in the loop and to save log(n) time for insertion of useless high costs if already visited)
 """
 
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Sequence
 from heapq import heappop, heappush
+from itertools import count
+from typing import Literal, cast
+
+from data_structures_and_algorithms.binary_heap import IndexedMinHeap
+from data_structures_and_algorithms.graph import CSRGraph, as_csr
 
 INF = float("inf")
 
+DIAL_MAX_WEIGHT = 256  # Above this maximum integer weight, the radix heap is used instead
+
+type Queue = Literal["auto", "heap", "indexed", "dial", "radix", "01bfs"]
+
 
 def dijkstra(
-    n: int, edges: Iterable[tuple[int, int, float]], src: int, dest: int
+    n: int,
+    edges: Iterable[tuple[int, int, float]] | CSRGraph,
+    src: int,
+    dest: int,
+    *,
+    queue: Queue = "auto",
 ) -> list[int] | None:
-    """Return the shortest path from src to dest in the graph or None if no path exists."""
+    """
+    Return the shortest path from src to dest in the graph or None if no path exists.
+
+    Edges can also be given as a prebuilt CSRGraph to skip the adjacency construction.
+    See `dijkstra_all` for the queue options.
+    """
     # Edges cases
     if n == 0:
         return None
-    # Adjacency list
-    neighbors = [[] for _ in range(n)]
-    for i, j, w in edges:
-        neighbors[i].append((w, j))  # (weight, node)
+
+    dist, prev = dijkstra_all(n, edges, src, targets=(dest,), queue=queue)
+    if dist[dest] == INF:
+        return None
+
+    return reconstruct_path(prev, dest)
+
+
+def dijkstra_all(
+    n: int,
+    edges: Iterable[tuple[int, int, float]] | CSRGraph,
+    src: int,
+    targets: Iterable[int] | None = None,
+    *,
+    queue: Queue = "auto",
+) -> tuple[list[float], list[int]]:
+    """
+    Return the dist and prev arrays of the shortest path tree from src.
+
+    Without targets, the whole tree is computed (one-to-all). With targets, the
+    search stops as soon as all of them are settled (one-to-many) and only the
+    dist and prev of settled nodes are final. Unreachable nodes have an infinite
+    distance, and paths are reconstructed on demand with `reconstruct_path`.
+
+    The priority queue is either:
+    - "heap": heapq with lazy deletion, up to E entries
+    - "indexed": IndexedMinHeap with decrease key, at most V entries and no tuple per push
+    - "dial": circular array of buckets, for small non-negative integer weights
+    - "radix": radix heap, for non-negative integer weights
+    - "01bfs": deque, for weights that are all 0 or 1
+    - "auto": the fastest applicable one given the weights (see `select_queue`)
+    """
+    # Adjacency in CSR format
+    graph = as_csr(n, edges)
+    remaining = None if targets is None else set(targets)
+    if queue == "auto":
+        queue = select_queue(graph)
+
+    return _ENGINES[queue](graph, src, remaining)
+
+
+def select_queue(graph: CSRGraph) -> Queue:
+    """
+    Return the priority queue best suited to the weights of the graph.
+
+    Integer weights use a bucket queue: "01bfs" if they are all 0 or 1, "dial" up to
+    DIAL_MAX_WEIGHT when V * max weight <= E (the O(V * C) steps over empty
+    buckets stay within the O(E) relaxations) and "radix" otherwise. Other weights
+    use "heap".
+    """
+    weights = graph.weights
+    if graph.weight_typecode != "q" or not weights or min(weights) < 0:
+        return "heap"
+    max_weight = max(weights)
+    if max_weight <= 1:
+        return "01bfs"
+    if max_weight <= DIAL_MAX_WEIGHT and graph.n * max_weight <= graph.num_edges:
+        return "dial"
+    return "radix"
+
+
+def _dijkstra_heap(
+    graph: CSRGraph, src: int, remaining: set[int] | None
+) -> tuple[list[float], list[int]]:
+    """Dijkstra with a heapq priority queue and lazy deletion of outdated entries."""
+    n = graph.n
+    offsets, neighbors, weights = graph.offsets, graph.targets, graph.weights
 
     # BFS with priority queue
-    pq = [(0, src, -1)]  # dist, node, prev
+    pq: list[tuple[float, int, int]] = [(0, src, -1)]  # dist, node, prev
     dist = [INF] * n
     dist[src] = 0
     prev = [-1] * n
+    visited = [False] * n
 
     while pq:
         node_dist, node, prev_node = heappop(pq)
         # Base case
-        if prev[node] != -1: # visited
+        if visited[node]:
             continue
+        visited[node] = True
         prev[node] = prev_node
-        if node == dest:
-            break
+        if remaining is not None:
+            remaining.discard(node)
+            if not remaining:
+                break
 
         # Iteration
-        for w, neib in neighbors[node]:
-            neib_dist = w + node_dist
+        for k in range(offsets[node], offsets[node + 1]):
+            neib = neighbors[k]
+            neib_dist = weights[k] + node_dist
             if neib_dist >= dist[neib]:
                 continue
             dist[neib] = neib_dist
             heappush(pq, (neib_dist, neib, node))
-    else:
-        return None
 
-    # Reconstruct the path
+    return dist, prev
+
+
+def _dijkstra_indexed(
+    graph: CSRGraph, src: int, remaining: set[int] | None
+) -> tuple[list[float], list[int]]:
+    """Dijkstra with an indexed heap: decrease key instead of pushing duplicates."""
+    n = graph.n
+    offsets, neighbors, weights = graph.offsets, graph.targets, graph.weights
+
+    # The keys of the heap are the distances
+    pq = IndexedMinHeap(n)
+    pq.push(src, 0)
+    dist = pq.keys
+    prev = [-1] * n
+
+    while pq:
+        node = pq.pop()
+        node_dist = dist[node]
+        # Base case
+        if remaining is not None:
+            remaining.discard(node)
+            if not remaining:
+                break
+
+        # Iteration
+        for k in range(offsets[node], offsets[node + 1]):
+            neib = neighbors[k]
+            neib_dist = weights[k] + node_dist
+            if neib_dist >= dist[neib]:  # Also skips settled nodes
+                continue
+            prev[neib] = node
+            if neib in pq:
+                pq.decrease_key(neib, neib_dist)
+            else:
+                pq.push(neib, neib_dist)
+
+    return dist, prev
+
+
+def _dijkstra_dial(
+    graph: CSRGraph, src: int, remaining: set[int] | None
+) -> tuple[list[float], list[int]]:
+    """Dijkstra with Dial's buckets: one bucket per distance, modulo the maximum weight + 1."""
+    n = graph.n
+    offsets, neighbors = graph.offsets, graph.targets
+    weights = cast(Sequence[int], graph.weights)  # Integer weights, see select_queue
+    # Pending distances are in [d, d + max_weight], so max_weight + 1 buckets are enough
+    num_buckets = max(weights, default=0) + 1
+
+    buckets = [[] for _ in range(num_buckets)]
+    buckets[0].append(src)
+    size = 1  # number of entries in the buckets
+    dist = [INF] * n
+    dist[src] = 0
+    prev = [-1] * n
+
+    node_dist = 0
+    while size:
+        bucket = buckets[node_dist % num_buckets]
+        # Zero weight edges can add nodes to the current bucket while it is emptied
+        while bucket:
+            node = bucket.pop()
+            size -= 1
+            # Base case
+            if dist[node] != node_dist:  # outdated
+                continue
+            if remaining is not None:
+                remaining.discard(node)
+                if not remaining:
+                    return dist, prev
+
+            # Iteration
+            for k in range(offsets[node], offsets[node + 1]):
+                neib = neighbors[k]
+                neib_dist = weights[k] + node_dist
+                if neib_dist >= dist[neib]:
+                    continue
+                dist[neib] = neib_dist
+                prev[neib] = node
+                buckets[neib_dist % num_buckets].append(neib)
+                size += 1
+        node_dist += 1
+
+    return dist, prev
+
+
+def _dijkstra_radix(
+    graph: CSRGraph, src: int, remaining: set[int] | None
+) -> tuple[list[float], list[int]]:
+    """
+    Dijkstra with a radix heap.
+
+    Popped keys never decrease, so an entry goes in the bucket of the highest bit
+    where its key differs from the last popped key. Only the first non-empty bucket
+    is redistributed, and entries only move to lower buckets.
+    """
+    n = graph.n
+    offsets, neighbors = graph.offsets, graph.targets
+    weights = cast(Sequence[int], graph.weights)  # Integer weights, see select_queue
+
+    buckets = [[] for _ in range(65)]  # bucket i: keys differing from last at bit i - 1
+    buckets[0].append((0, src))  # dist, node
+    size = 1
+    last = 0
+    dist = [INF] * n
+    dist[src] = 0
+    prev = [-1] * n
+
+    while size:
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            last = min(buckets[i])[0]
+            for entry in buckets[i]:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+            buckets[i] = []
+
+        node_dist, node = buckets[0].pop()
+        size -= 1
+        # Base case
+        if node_dist != dist[node]:  # outdated
+            continue
+        if remaining is not None:
+            remaining.discard(node)
+            if not remaining:
+                break
+
+        # Iteration
+        for k in range(offsets[node], offsets[node + 1]):
+            neib = neighbors[k]
+            neib_dist = weights[k] + node_dist
+            if neib_dist >= dist[neib]:
+                continue
+            dist[neib] = neib_dist
+            prev[neib] = node
+            buckets[(neib_dist ^ last).bit_length()].append((neib_dist, neib))
+            size += 1
+
+    return dist, prev
+
+
+def _dijkstra_01bfs(
+    graph: CSRGraph, src: int, remaining: set[int] | None
+) -> tuple[list[float], list[int]]:
+    """0-1 BFS: nodes reached by a 0 edge go to the front of the deque, by a 1 edge to the back."""
+    n = graph.n
+    offsets, neighbors, weights = graph.offsets, graph.targets, graph.weights
+
+    q = deque([src])
+    dist = [INF] * n
+    dist[src] = 0
+    prev = [-1] * n
+    visited = [False] * n
+
+    while q:
+        node = q.popleft()
+        # Base case
+        if visited[node]:
+            continue
+        visited[node] = True
+        if remaining is not None:
+            remaining.discard(node)
+            if not remaining:
+                break
+
+        # Iteration
+        node_dist = dist[node]
+        for k in range(offsets[node], offsets[node + 1]):
+            neib = neighbors[k]
+            w = weights[k]
+            if node_dist + w >= dist[neib]:
+                continue
+            dist[neib] = node_dist + w
+            prev[neib] = node
+            if w == 0:
+                q.appendleft(neib)
+            else:
+                q.append(neib)
+
+    return dist, prev
+
+
+_ENGINES = {
+    "heap": _dijkstra_heap,
+    "indexed": _dijkstra_indexed,
+    "dial": _dijkstra_dial,
+    "radix": _dijkstra_radix,
+    "01bfs": _dijkstra_01bfs,
+}
+
+
+def reconstruct_path(prev: list[int], dest: int) -> list[int]:
+    """Return the path from the source to dest by walking the prev array backward."""
     path = []
     node = dest
     while node != -1:
@@ -81,3 +381,149 @@ def dijkstra(
         node = prev[node]
 
     return path[::-1]
+
+
+def bidirectional_dijkstra(
+    n: int,
+    edges: Iterable[tuple[int, int, float]] | CSRGraph,
+    src: int,
+    dest: int,
+    reverse_graph: CSRGraph | None = None,
+) -> list[int] | None:
+    """
+    Return the shortest path from src to dest in the graph or None if no path exists.
+
+    The reversed graph is built from the edges if it is not given; pass it (e.g.
+    `graph.reverse()`) to reuse it between queries.
+    """
+    # Edges cases
+    if n == 0:
+        return None
+    if src == dest:
+        return [src]
+
+    graph = as_csr(n, edges)
+    if reverse_graph is None:
+        reverse_graph = graph.reverse()
+
+    dist_f, dist_b = [INF] * n, [INF] * n
+    prev_f, prev_b = [-1] * n, [-1] * n  # prev_b is the next node towards dest
+    dist_f[src] = dist_b[dest] = 0
+    pq_f: list[tuple[float, int]] = [(0, src)]  # dist, node
+    pq_b: list[tuple[float, int]] = [(0, dest)]
+    best, meet = INF, -1
+
+    while pq_f and pq_b:
+        # Stopping rule
+        if pq_f[0][0] + pq_b[0][0] >= best:
+            break
+        if pq_f[0][0] <= pq_b[0][0]:
+            best, meet = _bidirectional_step(pq_f, graph, dist_f, prev_f, dist_b, best, meet)
+        else:
+            best, meet = _bidirectional_step(
+                pq_b, reverse_graph, dist_b, prev_b, dist_f, best, meet
+            )
+
+    if meet == -1:
+        return None
+
+    # Reconstruct the path: src -> meet with prev_f, then meet -> dest with prev_b
+    path = reconstruct_path(prev_f, meet)
+    node = prev_b[meet]
+    while node != -1:
+        path.append(node)
+        node = prev_b[node]
+
+    return path
+
+
+def _bidirectional_step(  # noqa: PLR0913, PLR0917
+    pq: list[tuple[float, int]],
+    graph: CSRGraph,
+    dist: list[float],
+    prev: list[int],
+    other_dist: list[float],
+    best: float,
+    meet: int,
+) -> tuple[float, int]:
+    """Settle the top node of one side and return the updated best distance and meeting node."""
+    node_dist, node = heappop(pq)
+    # Base case: outdated entry
+    if node_dist > dist[node]:
+        return best, meet
+
+    # Iteration
+    offsets, neighbors, weights = graph.offsets, graph.targets, graph.weights
+    for k in range(offsets[node], offsets[node + 1]):
+        neib = neighbors[k]
+        neib_dist = weights[k] + node_dist
+        if neib_dist < dist[neib]:
+            dist[neib] = neib_dist
+            prev[neib] = node
+            heappush(pq, (neib_dist, neib))
+        # Meeting point candidate
+        if neib_dist + other_dist[neib] < best:
+            best = neib_dist + other_dist[neib]
+            meet = neib
+
+    return best, meet
+
+
+def dijkstra_implicit[T: Hashable](
+    src: T, dest: T, neighbors: Callable[[T], Iterable[tuple[T, float]]]
+) -> list[T] | None:
+    """
+    Return the shortest path from src to dest in an implicit graph or None if no path exists.
+
+    The graph is never materialized: neighbors(node) yields the (neighbor, weight)
+    pairs of a node, and nodes can be any hashable value (coordinates, states...).
+    """
+    dist, prev = dijkstra_implicit_all(src, neighbors, targets=(dest,))
+    if dest not in dist:
+        return None
+
+    path = [dest]
+    while path[-1] in prev:
+        path.append(prev[path[-1]])
+
+    return path[::-1]
+
+
+def dijkstra_implicit_all[T: Hashable](
+    src: T,
+    neighbors: Callable[[T], Iterable[tuple[T, float]]],
+    targets: Iterable[T] | None = None,
+) -> tuple[dict[T, float], dict[T, T]]:
+    """
+    Return the dist and prev dicts of the shortest path tree from src in an implicit graph.
+
+    Like `dijkstra_all`, but the dicts only contain the explored nodes (the source
+    has no prev): memory grows with the explored region instead of the whole graph.
+    With targets, the search stops as soon as all of them are settled, and the
+    nodes left on the frontier have tentative distances.
+    """
+    dist: dict[T, float] = {src: 0}
+    prev: dict[T, T] = {}
+    remaining = None if targets is None else set(targets)
+    tie_breaker = count()  # Nodes are not necessarily comparable
+    pq: list[tuple[float, int, T]] = [(0, next(tie_breaker), src)]  # dist, tie breaker, node
+
+    while pq:
+        node_dist, _, node = heappop(pq)
+        # Base case: outdated entry
+        if node_dist > dist[node]:
+            continue
+        if remaining is not None:
+            remaining.discard(node)
+            if not remaining:
+                break
+
+        # Iteration
+        for neib, weight in neighbors(node):
+            neib_dist = node_dist + weight
+            if neib_dist < dist.get(neib, INF):
+                dist[neib] = neib_dist
+                prev[neib] = node
+                heappush(pq, (neib_dist, next(tie_breaker), neib))
+
+    return dist, prev
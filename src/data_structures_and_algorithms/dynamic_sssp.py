@@ -0,0 +1,176 @@
+"""
+Dynamic single-source shortest paths.
+
+Maintain the shortest path tree of a source (dist and prev arrays) while edges
+are added, removed or reweighted, repairing only the nodes affected by each
+update instead of running Dijkstra from scratch (in the spirit of
+Ramalingam-Reps).
+
+Use cases:
+- Routing tables or distances that stay live while a few edges change at a time
+    (traffic, link failures, ...) in a graph with non-negative edges
+
+Algorithm:
+- Build the initial tree with dijkstra_all, keep in and out adjacency dicts
+- Weight decrease (or new edge) u -> v:
+    - Nothing to do unless dist[u] + w < dist[v]
+    - Else update v and run Dijkstra from v: only the nodes whose distance
+        decreases are pushed
+- Weight increase (or removed edge) u -> v:
+    - Nothing to do unless (u, v) is a tree edge (prev[v] == u)
+    - Else the distances can only change in the subtree of v: reset them, give each
+        one its best distance through an in edge from outside the subtree
+    - Run Dijkstra from these nodes, restricted in practice to the subtree (the
+        distances outside of it can't decrease)
+
+Complexity: V nodes and E edges
+- Initialization: same as Dijkstra
+- Update: O(A log A + edges of A) where A is the number of affected nodes,
+    instead of O(E log V) for a full recomputation
+
+Tips:
+- Node outside the subtree of v: its tree path doesn't use (u, v), so its distance is unchanged
+- Node inside: its new distance is either through an in edge from outside the
+    subtree (seed) or through another node of the subtree (propagation)
+- Parallel edges are merged by keeping the lowest weight
+"""
+
+from collections.abc import Iterable
+from heapq import heapify, heappop, heappush
+
+from data_structures_and_algorithms.dijkstra import INF, dijkstra_all, reconstruct_path
+from data_structures_and_algorithms.graph import CSRGraph
+
+
+class DynamicSSSP:
+    """Shortest path tree from a source, repaired incrementally on edge updates."""
+
+    def __init__(
+        self, n: int, edges: Iterable[tuple[int, int, float]] | CSRGraph, src: int
+    ) -> None:
+        self.n: int = n
+        self.src: int = src
+        self.out: list[dict[int, float]] = [{} for _ in range(n)]  # u -> v -> weight
+        self.inc: list[dict[int, float]] = [{} for _ in range(n)]  # v -> u -> weight
+        for u, v, w in edges:
+            _check_weight(w)
+            if w < self.out[u].get(v, INF):
+                self.out[u][v] = w
+                self.inc[v][u] = w
+
+        self.dist: list[float]
+        self.prev: list[int]
+        self.dist, self.prev = dijkstra_all(
+            n, [(u, v, w) for u in range(n) for v, w in self.out[u].items()], src
+        )
+
+    def path(self, dest: int) -> list[int] | None:
+        """Return the current shortest path from the source to dest or None if no path exists."""
+        if self.dist[dest] == INF:
+            return None
+        return reconstruct_path(self.prev, dest)
+
+    def add_edge(self, u: int, v: int, w: float) -> None:
+        """Add the edge u -> v of weight w."""
+        if v in self.out[u]:
+            msg = f"Edge ({u}, {v}) already exists"
+            raise ValueError(msg)
+        _check_weight(w)
+        self._set_weight(u, v, w)
+        self._repair_decrease(u, v)
+
+    def remove_edge(self, u: int, v: int) -> None:
+        """Remove the edge u -> v."""
+        self._get_weight(u, v)
+        del self.out[u][v]
+        del self.inc[v][u]
+        self._repair_increase(u, v)
+
+    def decrease_weight(self, u: int, v: int, w: float) -> None:
+        """Lower the weight of the edge u -> v to w."""
+        if w > self._get_weight(u, v):
+            msg = f"New weight {w} is higher than the weight of ({u}, {v})"
+            raise ValueError(msg)
+        _check_weight(w)
+        self._set_weight(u, v, w)
+        self._repair_decrease(u, v)
+
+    def increase_weight(self, u: int, v: int, w: float) -> None:
+        """Raise the weight of the edge u -> v to w."""
+        if w < self._get_weight(u, v):
+            msg = f"New weight {w} is lower than the weight of ({u}, {v})"
+            raise ValueError(msg)
+        self._set_weight(u, v, w)
+        self._repair_increase(u, v)
+
+    def _get_weight(self, u: int, v: int) -> float:
+        """Return the weight of the edge u -> v, raising if it doesn't exist."""
+        if v not in self.out[u]:
+            msg = f"Edge ({u}, {v}) doesn't exist"
+            raise ValueError(msg)
+        return self.out[u][v]
+
+    def _set_weight(self, u: int, v: int, w: float) -> None:
+        self.out[u][v] = w
+        self.inc[v][u] = w
+
+    def _repair_decrease(self, u: int, v: int) -> None:
+        """Propagate the shorter paths going through the cheaper edge u -> v."""
+        new_dist = self.dist[u] + self.out[u][v]
+        if new_dist < self.dist[v]:
+            self.dist[v] = new_dist
+            self.prev[v] = u
+            self._propagate([(new_dist, v)])
+
+    def _repair_increase(self, u: int, v: int) -> None:
+        """Recompute the subtree of v after the tree edge u -> v got more expensive."""
+        if self.prev[v] != u:
+            return
+
+        dist, prev = self.dist, self.prev
+        affected = self._subtree(v)
+        for node in affected:
+            dist[node] = INF
+            prev[node] = -1
+
+        # Seed each affected node with its best in edge from an unaffected node
+        pq = []
+        for node in affected:
+            for pred, w in self.inc[node].items():
+                if dist[pred] + w < dist[node]:
+                    dist[node] = dist[pred] + w
+                    prev[node] = pred
+            if dist[node] != INF:
+                pq.append((dist[node], node))
+        heapify(pq)
+        self._propagate(pq)
+
+    def _subtree(self, root: int) -> list[int]:
+        """Return the nodes of the shortest path tree rooted at root."""
+        subtree = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            subtree.append(node)
+            stack.extend(child for child in self.out[node] if self.prev[child] == node)
+        return subtree
+
+    def _propagate(self, pq: list[tuple[float, int]]) -> None:
+        """Run Dijkstra from the nodes of the heap, whose dist and prev are already set."""
+        dist, prev = self.dist, self.prev
+        while pq:
+            d, u = heappop(pq)
+            if d > dist[u]:
+                continue  # Outdated entry
+            for v, w in self.out[u].items():
+                new_dist = d + w
+                if new_dist < dist[v]:
+                    dist[v] = new_dist
+                    prev[v] = u
+                    heappush(pq, (new_dist, v))
+
+
+def _check_weight(w: float) -> None:
+    if w < 0:
+        msg = f"Negative weight {w}: use bellman_ford instead"
+        raise ValueError(msg)
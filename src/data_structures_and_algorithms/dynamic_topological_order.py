@@ -0,0 +1,120 @@
+"""
+Dynamic topological order (Pearce-Kelly algorithm).
+
+Maintain a topological order of a DAG while edges are inserted one at a time,
+rejecting the edges that would create a cycle, without recomputing the whole
+order (O(V + E) with Khan's algorithm) at each insertion.
+
+Use cases:
+- Dependency graphs built incrementally, with cycle rejection on every insertion
+- Deadlock detection (wait-for graphs), incremental build systems, spreadsheets
+
+Algorithm:
+- Keep ord[node] (position in the order) and its inverse node_at[position]
+- Insert u -> v:
+    - ord[u] < ord[v]: the order is still valid, nothing to do
+    - Else, the affected region is [ord[v], ord[u]]:
+        - Forward DFS from v on the nodes with ord <= ord[u]: reaching u means a cycle
+        - Backward DFS from u on the nodes with ord >= ord[v]
+        - Reorder: reuse the positions of the visited nodes, putting the backward
+            set first, then the forward set, each in their previous relative order
+- Remove u -> v: the order stays valid, nothing to do
+
+Complexity:
+- Insertion: O(|δ| log |δ| + edges of δ), δ the visited nodes of the affected region
+    (O(V + E) in the worst case, much less in practice)
+- Removal: O(1)
+
+Tips:
+- Only the positions of the visited nodes are reused: nodes outside the region
+    (and unvisited nodes inside it) keep their position
+- Check for a cycle before modifying anything, the structure stays valid when an edge is rejected
+"""
+
+from collections.abc import Iterable
+
+from data_structures_and_algorithms.graph import CSRGraph
+from data_structures_and_algorithms.khan import khan_layers
+
+
+class DynamicTopologicalOrder:
+    """Topological order of a DAG maintained under edge insertions and removals."""
+
+    def __init__(self, n: int, edges: Iterable[tuple[int, int]] | CSRGraph = ()) -> None:
+        edge_list = list(edges)
+        layers = khan_layers(n, [(u, v) for u, v, *_ in edge_list])
+        if layers is None:
+            msg = "The graph has a cycle"
+            raise ValueError(msg)
+
+        self.node_at: list[int] = [node for layer in layers for node in layer]
+        self.ord: list[int] = [0] * n
+        for position, node in enumerate(self.node_at):
+            self.ord[node] = position
+
+        self.out: list[set[int]] = [set() for _ in range(n)]
+        self.inc: list[set[int]] = [set() for _ in range(n)]
+        for u, v, *_ in edge_list:
+            self.out[u].add(v)
+            self.inc[v].add(u)
+
+    @property
+    def order(self) -> list[int]:
+        """Current topological order."""
+        return list(self.node_at)
+
+    def add_edge(self, u: int, v: int) -> None:
+        """Add the edge u -> v, raising ValueError if it would create a cycle."""
+        lower, upper = self.ord[v], self.ord[u]
+        if lower < upper:
+            forward = self._forward(v, upper, u)
+            if forward is None:
+                msg = f"Edge ({u}, {v}) would create a cycle"
+                raise ValueError(msg)
+            self._reorder(self._backward(u, lower), forward)
+        elif u == v:
+            msg = f"Edge ({u}, {v}) is a self loop"
+            raise ValueError(msg)
+
+        self.out[u].add(v)
+        self.inc[v].add(u)
+
+    def remove_edge(self, u: int, v: int) -> None:
+        """Remove the edge u -> v, the order stays valid."""
+        self.out[u].discard(v)
+        self.inc[v].discard(u)
+
+    def _forward(self, start: int, upper: int, target: int) -> list[int] | None:
+        """Return the nodes reachable from start with ord <= upper, or None if target is reached."""
+        visited = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for neib in self.out[node]:
+                if neib == target:
+                    return None
+                if neib not in visited and self.ord[neib] <= upper:
+                    visited.add(neib)
+                    stack.append(neib)
+        return list(visited)
+
+    def _backward(self, start: int, lower: int) -> list[int]:
+        """Return the nodes reaching start with ord >= lower."""
+        visited = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for neib in self.inc[node]:
+                if neib not in visited and self.ord[neib] >= lower:
+                    visited.add(neib)
+                    stack.append(neib)
+        return list(visited)
+
+    def _reorder(self, backward: list[int], forward: list[int]) -> None:
+        """Place the backward nodes before the forward nodes in the positions they occupy."""
+        backward.sort(key=self.ord.__getitem__)
+        forward.sort(key=self.ord.__getitem__)
+        positions = sorted(self.ord[node] for node in backward + forward)
+        for position, node in zip(positions, backward + forward, strict=True):
+            self.ord[node] = position
+            self.node_at[position] = node
@@ -0,0 +1,175 @@
+"""
+External memory (out-of-core) Kruskal's algorithm.
+
+Minimum spanning tree of a graph whose edge list doesn't fit in memory: the
+edges are read from a binary file, sorted on disk with an external merge sort and
+streamed by increasing weight into the union-find of Kruskal's algorithm.
+
+Edge file format: a sequence of records of 24 bytes, little-endian int64 u,
+int64 v and float64 w (e.g. a numpy structured array with dtype
+[("u", "<i8"), ("v", "<i8"), ("w", "<f8")] written with tofile).
+
+Use cases:
+- Minimum spanning tree/forest of edge lists larger than RAM (tens of GB)
+
+Algorithm:
+- Run formation: read chunks of edges, sort each chunk in memory by weight and
+    write it to a temporary run file
+- K-way merge of the runs with a heap (heapq.merge), each run read through a
+    small buffer
+- More runs than the merge fan-in: merge them by groups into longer runs first,
+    so that at most fan-in run files are open at once (ulimit -n)
+- Feed the merged stream to the disjoint set, stop after V - 1 accepted edges
+
+Complexity: V nodes, E edges, M edges per chunk, B edges per read buffer, F merge fan-in
+- O(E log E) time, 2 * max(1, ceil(log_F(E / M))) passes over the data on disk
+    (write + read of the runs at each merge level)
+- Memory: O(V) for the disjoint set, O(M) during run formation,
+    O(min(F, E / M) * B) merge buffers
+
+Tips:
+- Read and write whole blocks (struct.iter_unpack / Struct.pack_into), not one
+    record at a time
+- The merge is lazy: stopping at V - 1 edges skips the rest of the runs
+- Larger chunks mean fewer runs, so fewer merge buffers and heap entries
+- Close the run files explicitly (not the generators reading them) before the
+    temporary directory is removed
+"""
+
+import operator
+import struct
+import tempfile
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from heapq import merge
+from pathlib import Path
+from typing import BinaryIO
+
+from data_structures_and_algorithms.disjoint_set import DisjointSet
+
+EDGE_RECORD = struct.Struct("<qqd")  # u, v, w
+DEFAULT_CHUNK_SIZE = 1 << 20  # Edges sorted in memory per run (24 MB of records)
+DEFAULT_BUFFER_SIZE = 1 << 12  # Edges read at once from a file
+DEFAULT_MERGE_FAN_IN = 64  # Run files merged (and open) at once
+MIN_MERGE_FAN_IN = 2
+
+
+def write_edge_file(path: str | Path, edges: Iterable[tuple[int, int, float]]) -> None:
+    """Write the edges to a binary edge file, one block of DEFAULT_BUFFER_SIZE edges at a time."""
+    block = bytearray(DEFAULT_BUFFER_SIZE * EDGE_RECORD.size)
+    offset = 0
+    with Path(path).open("wb") as f:
+        for u, v, w in edges:
+            EDGE_RECORD.pack_into(block, offset, u, v, w)
+            offset += EDGE_RECORD.size
+            if offset == len(block):
+                f.write(block)
+                offset = 0
+        f.write(block[:offset])
+
+
+def read_edge_file(
+    path: str | Path, buffer_size: int = DEFAULT_BUFFER_SIZE
+) -> Iterator[tuple[int, int, float]]:
+    """Yield the (u, v, w) edges of a binary edge file, reading buffer_size edges at a time."""
+    with Path(path).open("rb") as f:
+        yield from _read_edges(f, buffer_size)
+
+
+def external_kruskal(
+    n: int,
+    path: str | Path,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    merge_fan_in: int = DEFAULT_MERGE_FAN_IN,
+    tmp_dir: str | Path | None = None,
+) -> list[tuple[int, int, float]]:
+    """
+    Return the edges of a minimum spanning tree of the graph stored in a binary edge file.
+
+    Same result as `kruskal.kruskal`, but the edges are sorted on disk in runs of
+    chunk_size edges (in tmp_dir, the default temporary directory otherwise),
+    merged at most merge_fan_in runs at a time.
+    """
+    if merge_fan_in < MIN_MERGE_FAN_IN:
+        msg = f"merge_fan_in must be at least {MIN_MERGE_FAN_IN}, got {merge_fan_in}"
+        raise ValueError(msg)
+
+    disjoint_set = DisjointSet(n)
+    res = []
+    if n <= 1:
+        return res
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as run_dir:
+        runs = _sorted_runs(path, Path(run_dir), chunk_size, buffer_size)
+        runs = _merge_passes(runs, Path(run_dir), merge_fan_in, buffer_size)
+        # Close the run files before the directory is removed
+        with ExitStack() as files:
+            for edge in _merged_runs(runs, files, buffer_size):
+                u, v, _ = edge
+                u_class, v_class = disjoint_set.find(u), disjoint_set.find(v)
+                if u_class == v_class:
+                    continue
+                disjoint_set.union(u_class, v_class)
+                res.append(edge)
+                if len(res) == n - 1:
+                    break
+
+    return res
+
+
+def _sorted_runs(path: str | Path, run_dir: Path, chunk_size: int, buffer_size: int) -> list[Path]:
+    """Split the edge file in sorted run files of chunk_size edges and return their paths."""
+    runs = []
+    chunk = []
+    for edge in read_edge_file(path, buffer_size):
+        chunk.append(edge)
+        if len(chunk) == chunk_size:
+            runs.append(_write_run(run_dir / f"run_{len(runs)}.bin", chunk))
+            chunk = []
+    if chunk:
+        runs.append(_write_run(run_dir / f"run_{len(runs)}.bin", chunk))
+    return runs
+
+
+def _write_run(path: Path, chunk: list[tuple[int, int, float]]) -> Path:
+    """Sort the chunk by weight and write it to a run file."""
+    chunk.sort(key=operator.itemgetter(2))
+    write_edge_file(path, chunk)
+    return path
+
+
+def _merge_passes(runs: list[Path], run_dir: Path, fan_in: int, buffer_size: int) -> list[Path]:
+    """Merge the runs by groups of fan_in into longer runs until at most fan_in are left."""
+    merge_pass = 0
+    while len(runs) > fan_in:
+        merged_runs = []
+        for i in range(0, len(runs), fan_in):
+            group = runs[i : i + fan_in]
+            merged_run = run_dir / f"merge_{merge_pass}_{len(merged_runs)}.bin"
+            with ExitStack() as files:
+                write_edge_file(merged_run, _merged_runs(group, files, buffer_size))
+            for run in group:
+                run.unlink()
+            merged_runs.append(merged_run)
+        runs = merged_runs
+        merge_pass += 1
+    return runs
+
+
+def _merged_runs(
+    runs: list[Path], files: ExitStack, buffer_size: int
+) -> Iterator[tuple[int, int, float]]:
+    """Return the edges of the runs merged by weight, their files are closed with the stack."""
+    readers = [_read_edges(files.enter_context(run.open("rb")), buffer_size) for run in runs]
+    return merge(*readers, key=operator.itemgetter(2))
+
+
+def _read_edges(f: BinaryIO, buffer_size: int) -> Iterator[tuple[int, int, float]]:
+    """Yield the (u, v, w) edges of an open edge file, reading buffer_size edges at a time."""
+    while block := f.read(buffer_size * EDGE_RECORD.size):
+        if len(block) % EDGE_RECORD.size:
+            msg = f"Truncated edge file: {f.name}"
+            raise ValueError(msg)
+        yield from EDGE_RECORD.iter_unpack(block)
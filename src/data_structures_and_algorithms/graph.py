@@ -0,0 +1,183 @@
+"""
+Compressed Sparse Row (CSR) graph.
+
+A compact, immutable representation of a directed weighted graph where the
+edges are stored in 3 contiguous buffers instead of a list of lists:
+- offsets: the out edges of node u are the indices offsets[u]:offsets[u + 1]
+- targets: the head of each edge
+- weights: the weight of each edge
+
+Build it once with `CSRGraph.from_edges` and pass it directly to the graph
+algorithms of the package (dijkstra, bellman_ford, khan, kruskal...) instead of
+an edge list to skip the adjacency list construction on each call.
+
+Use cases:
+- Running many queries on the same (large) graph
+- Sharing a graph between processes (the buffers are plain memory)
+
+Complexity: V nodes and E edges
+- Construction: O(V + E) with a counting sort on the source of the edges
+- Memory: V + 1 offsets and 2 * E values instead of E tuples and V lists
+- Out edges of a node: O(1) access
+
+Tips:
+- offsets is the prefix sum of the out degrees (offsets[0] = 0, offsets[n] = E)
+- Fill the buffers with a cursor per node starting at offsets[u]
+- Weights are stored as integers if they are all integers ('q'), as floats ('d') otherwise
+- save/load write the raw buffers to a file that is memory mapped back (no parsing, pages
+    shared between processes)
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from array import array
+from pathlib import Path
+from typing import TYPE_CHECKING, override
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+type Edge = tuple[int, int] | tuple[int, int, float]
+
+_WEIGHTED_EDGE_LEN = 3  # (u, v, w)
+_MAGIC = b"CSR1"
+_HEADER = struct.Struct("<4s4xqq8s")  # magic, n, number of edges, weight typecode
+
+
+class CSRGraph:
+    """Directed weighted graph in compressed sparse row format."""
+
+    def __init__(
+        self,
+        n: int,
+        offsets: Sequence[int],
+        targets: Sequence[int],
+        weights: Sequence[float],
+    ) -> None:
+        self.n: int = n
+        self.offsets: Sequence[int] = offsets
+        self.targets: Sequence[int] = targets
+        self.weights: Sequence[float] = weights
+        self._sources: Sequence[int] | None = None
+
+    @classmethod
+    def from_edges(cls, n: int, edges: Iterable[Edge]) -> CSRGraph:
+        """
+        Build the graph from (u, v, w) edges.
+
+        Unweighted (u, v) edges get a weight of 1.
+        """
+        # 1. Unpack the edges once into flat buffers
+        us, vs, ws = array("q"), array("q"), []
+        for edge in edges:
+            us.append(edge[0])
+            vs.append(edge[1])
+            ws.append(edge[2] if len(edge) == _WEIGHTED_EDGE_LEN else 1)
+        is_int = all(type(w) is int for w in ws)
+        weights_in = array("q" if is_int else "d", ws)
+
+        # 2. Count the out degrees and compute their prefix sum
+        offsets = array("q", bytes(8 * (n + 1)))
+        for u in us:
+            offsets[u + 1] += 1
+        for u in range(n):
+            offsets[u + 1] += offsets[u]
+
+        # 3. Place each edge at the cursor of its source
+        m = len(us)
+        cursors = offsets[:-1]
+        targets = array("q", bytes(8 * m))
+        weights = array(weights_in.typecode, bytes(weights_in.itemsize * m))
+        for u, v, w in zip(us, vs, weights_in, strict=True):
+            k = cursors[u]
+            targets[k] = v
+            weights[k] = w
+            cursors[u] = k + 1
+
+        return cls(n, offsets, targets, weights)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of edges."""
+        return len(self.targets)
+
+    @property
+    def weight_typecode(self) -> str:
+        """Item type of the weights: 'q' for integers, 'd' for floats."""
+        weights = self.weights
+        return weights.typecode if isinstance(weights, array) else weights.format  # pyright: ignore[reportAttributeAccessIssue]
+
+    @property
+    def sources(self) -> Sequence[int]:
+        """Source of each edge (computed once, on demand)."""
+        if self._sources is None:
+            sources = array("q", bytes(8 * self.num_edges))
+            offsets = self.offsets
+            for u in range(self.n):
+                for k in range(offsets[u], offsets[u + 1]):
+                    sources[k] = u
+            self._sources = sources
+        return self._sources
+
+    def neighbors(self, u: int) -> Iterator[tuple[int, float]]:
+        """Iterate over the (v, w) out edges of u."""
+        start, end = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[start:end], self.weights[start:end], strict=True)
+
+    def reverse(self) -> CSRGraph:
+        """Return the graph with all its edges reversed."""
+        return CSRGraph.from_edges(
+            self.n, zip(self.targets, self.sources, self.weights, strict=True)
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Write the graph to a binary file that can be memory mapped by `load`."""
+        with Path(path).open("wb") as f:
+            f.write(_HEADER.pack(_MAGIC, self.n, self.num_edges, self.weight_typecode.encode()))
+            f.writelines((self.offsets, self.targets, self.weights))  # pyright: ignore[reportArgumentType]
+
+    @classmethod
+    def load(cls, path: str | Path, *, use_mmap: bool = True) -> CSRGraph:
+        """
+        Read a graph written by `save`.
+
+        With use_mmap, the buffers are views on a read-only memory map of the file: loading
+        is immediate and processes loading the same file share its pages.
+        """
+        with Path(path).open("rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if use_mmap else f.read()
+        magic, n, m, typecode = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC:
+            msg = f"{path} is not a CSR graph file"
+            raise ValueError(msg)
+
+        # The views keep the memory map alive
+        view = memoryview(buffer)
+        offsets_end = _HEADER.size + 8 * (n + 1)
+        targets_end = offsets_end + 8 * m
+        return cls(
+            n,
+            view[_HEADER.size : offsets_end].cast("q"),
+            view[offsets_end:targets_end].cast("q"),
+            view[targets_end : targets_end + 8 * m].cast(typecode.rstrip(b"\0").decode()),
+        )
+
+    def __iter__(self) -> Iterator[tuple[int, int, float]]:
+        """Iterate over the (u, v, w) edges, in source order."""
+        return zip(self.sources, self.targets, self.weights, strict=True)
+
+    @override
+    def __repr__(self) -> str:
+        return f"CSRGraph(n={self.n}, num_edges={self.num_edges})"
+
+
+def as_csr(n: int, edges: Iterable[Edge] | CSRGraph) -> CSRGraph:
+    """Return the edges as a CSR graph, building it only if they are not one already."""
+    if isinstance(edges, CSRGraph):
+        if edges.n != n:
+            msg = f"Graph has {edges.n} nodes, expected {n}"
+            raise ValueError(msg)
+        return edges
+    return CSRGraph.from_edges(n, edges)
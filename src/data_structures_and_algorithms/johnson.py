@@ -0,0 +1,80 @@
+"""
+Johnson's algorithm.
+
+All-pairs shortest paths in a sparse graph with negative edges (but no negative
+cycles): one Bellman-Ford to remove the negative weights, then one Dijkstra per
+source on the reweighted graph.
+
+Use cases:
+- Distance matrices on sparse graphs with negative edges, where V Bellman-Ford
+    (O(V^2 * E)) or Floyd-Warshall (O(V^3)) would be too slow
+
+Algorithm:
+- Add a virtual source linked to every node with a 0 weight edge
+- Bellman-Ford from the virtual source gives potentials h (h[v] <= 0), or a negative cycle
+- Reweight each edge: w'(u, v) = w(u, v) + h[u] - h[v] >= 0
+- Run Dijkstra from each source on the reweighted graph
+- Restore the distances: dist(s, v) = dist'(s, v) - h[s] + h[v]
+
+Complexity: V nodes and E edges
+- O(V * E) for Bellman-Ford, then O(V * E log V) for the V Dijkstra
+- Memory: O(V^2) for the result
+
+Tips:
+- The reweighting preserves the shortest paths: every path from s to v changes by
+    the same amount h[s] - h[v] (telescoping sum), so the prev rows are the same
+- h[v] <= h[u] + w(u, v) is the triangle inequality of the shortest distances:
+    it is why the reweighted edges are non-negative
+- The Dijkstra runs are independent: they can be spread over a process pool
+    (see `all_pairs`)
+"""
+
+from collections.abc import Iterable
+
+from data_structures_and_algorithms.all_pairs import all_pairs_shortest_path_trees
+from data_structures_and_algorithms.bellman_ford import bellman_ford_opti
+from data_structures_and_algorithms.dijkstra import INF, dijkstra_all
+from data_structures_and_algorithms.graph import CSRGraph
+
+
+def johnson(
+    n: int,
+    edges: Iterable[tuple[int, int, float]] | CSRGraph,
+    *,
+    max_workers: int | None = 1,
+) -> tuple[list[list[float]], list[list[int]]] | tuple[None, list[int]]:
+    """
+    Return the (dist, prev) matrices of all-pairs shortest paths or a detected negative cycle.
+
+    dist[s][v] is the length of the shortest path from s to v and prev[s] the
+    predecessors to reconstruct it with `dijkstra.reconstruct_path`. With
+    max_workers != 1, the Dijkstra runs are spread over a process pool.
+    """
+    edges = list(edges)
+
+    # Potentials: shortest distances from a virtual source n linked to every node
+    virtual_edges = edges + [(n, v, 0) for v in range(n)]
+    potentials, cycle = bellman_ford_opti(n + 1, virtual_edges, n)
+    if potentials is None:
+        return None, cycle
+
+    # max(0, ...) absorbs the rounding errors of float weights
+    reweighted = CSRGraph.from_edges(
+        n, [(u, v, max(0, w + potentials[u] - potentials[v])) for u, v, w in edges]
+    )
+    if max_workers == 1:
+        trees = ((src, *dijkstra_all(n, reweighted, src)) for src in range(n))
+    else:
+        trees = all_pairs_shortest_path_trees(n, reweighted, max_workers=max_workers)
+
+    dist: list[list[float]] = [[] for _ in range(n)]
+    prev: list[list[int]] = [[] for _ in range(n)]
+    for src, src_dist, src_prev in trees:
+        h_src = potentials[src]
+        dist[src] = [
+            d - h_src + h_v if d != INF else INF
+            for d, h_v in zip(src_dist, potentials, strict=False)
+        ]
+        prev[src] = list(src_prev)
+
+    return dist, prev
@@ -15,9 +15,18 @@ Algorithm:
         - Run dfs on it if its degree is 0
 - !!Check if the length of the order is the same as the number of nodes, as there could be connected components without node of degree 0
 
+The DFS is implemented with an explicit stack (no recursion limit on long
+chains), and `iter_khan_dfs` streams the order as it is found.
+
 Note: Can also be done by removing edges in the graph instead of counting incoming degree.
 In this case, you can the check if there is any remaining edges instead of checking the length of the order
 
+Layers (`khan_layers`):
+- BFS by waves: layer k + 1 is the set of nodes whose in degree reaches 0 while
+    removing the nodes of layer k
+- Nodes of the same layer don't depend on each other (antichain): they can run in parallel
+- The number of layers is the critical path depth (number of nodes of the longest path)
+
 Complexity:
 - O(V + E) as a traversal where each node is visited once and each edge taken once
 
@@ -25,64 +34,93 @@ Tips:
 - Start the traversal on each node with incoming degree of 0 to handle multiple connected components.
 - Check the length of the order at the end in case there is a connected component without any node of incoming degree 0
 - !!You don't need to explicitly check for cycles since a cycle will never be added to the order list -> so no need visited array either
+- To know which nodes form the cycles, use `scc.find_cycles` (strongly connected components)
 """
 
 from collections import deque
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+
+from data_structures_and_algorithms.graph import CSRGraph, as_csr
 
 
-def khan_dfs(n: int, edges: Iterable[tuple[int, int]]) -> list[int] | None:
+def khan_dfs(n: int, edges: Iterable[tuple[int, int]] | CSRGraph) -> list[int] | None:
     """
     Return a topological order if possible, and None if there is at least one cycle.
 
     Nodes are integers from 0 to n - 1 and edges are considered unique.
-    Edges are given as:  (u, v), and the order is a list of nodes.
+    Edges are given as:  (u, v) or as a prebuilt CSRGraph, and the order is a list of nodes.
+    """
+    order = list(_khan_dfs(as_csr(n, edges)))
+
+    # Check if the length is coherent
+    if len(order) != n:
+        print(order)
+    return order if len(order) == n else None
+
+
+def iter_khan_dfs(n: int, edges: Iterable[tuple[int, int]] | CSRGraph) -> Iterator[int]:
     """
+    Yield the nodes of the same topological order as `khan_dfs`, as soon as they are found.
+
+    Raise ValueError after the last reachable node if there is at least one cycle.
+    """
+    count = 0
+    for node in _khan_dfs(as_csr(n, edges)):
+        yield node
+        count += 1
+
+    if count != n:
+        msg = f"The graph has a cycle: {n - count} nodes can't be ordered"
+        raise ValueError(msg)
+
+
+def _khan_dfs(graph: CSRGraph) -> Iterator[int]:
+    """Yield the nodes of the DFS topological order, except the nodes of cycles and their descendants."""
     # 1. Create graph, e.g. as adjacency list and count incoming degrees
-    in_degrees = [0] * n
-    neighbors = [[] for _ in range(n)]
+    offsets, targets = graph.offsets, graph.targets
+    in_degrees = [0] * graph.n
 
-    for u, v in edges:
+    for v in targets:
         in_degrees[v] += 1
-        neighbors[u].append(v)
 
     # 2. Traversal on each node with in degree of 0
-    order = []
-
-    def dfs(node: int) -> None:
+    # Explicit stack of (node, next edge position) frames instead of recursion,
+    # visiting the nodes in the same order as the recursive DFS
+    sources = [node for node, degree in enumerate(in_degrees) if degree == 0]
+    for source in sources:
         # Base case
-        order.append(node)
-
-        # Recursion
-        for neib in neighbors[node]:
+        yield source
+        frames = [(source, offsets[source])]
+
+        while frames:
+            node, k = frames[-1]
+            if k == offsets[node + 1]:
+                frames.pop()
+                continue
+
+            # Recursion
+            frames[-1] = (node, k + 1)
+            neib = targets[k]
             in_degrees[neib] -= 1
             if in_degrees[neib] == 0:
-                dfs(neib)
-
-    sources = [node for node, degree in enumerate(in_degrees) if degree == 0]
-    for node in sources:
-        dfs(node)
-
-    # Check if the length is coherent
-    if len(order) != n:
-        print(order)
-    return order if len(order) == n else None
+                yield neib
+                frames.append((neib, offsets[neib]))
 
 
-def khan_bfs(n: int, edges: Iterable[tuple[int, int]]) -> list[int] | None:
+def khan_bfs(n: int, edges: Iterable[tuple[int, int]] | CSRGraph) -> list[int] | None:
     """
     Return a topological order if possible, and None if there is at least one cycle.
 
     Nodes are integers from 0 to n - 1 and edges are considered unique.
-    Edges are given as:  (u, v), and the order is a list of nodes.
+    Edges are given as:  (u, v) or as a prebuilt CSRGraph, and the order is a list of nodes.
     """
     # 1. Create graph, e.g. as adjacency list and count incoming degrees
+    graph = as_csr(n, edges)
+    offsets, targets = graph.offsets, graph.targets
     in_degrees = [0] * n
-    neighbors = [[] for _ in range(n)]
 
-    for u, v in edges:
+    for v in targets:
         in_degrees[v] += 1
-        neighbors[u].append(v)
 
     # 2. Traversal on each node with in degree of 0
     order = []
@@ -95,7 +133,7 @@ def khan_bfs(n: int, edges: Iterable[tuple[int, int]]) -> list[int] | None:
         order.append(node)
 
         # iteration
-        for neib in neighbors[node]:
+        for neib in targets[offsets[node] : offsets[node + 1]]:
             in_degrees[neib] -= 1
             if in_degrees[neib] == 0:
                 q.append(neib)
@@ -105,3 +143,39 @@ def khan_bfs(n: int, edges: Iterable[tuple[int, int]]) -> list[int] | None:
         print(order)
 
     return order if len(order) == n else None
+
+
+def khan_layers(n: int, edges: Iterable[tuple[int, int]] | CSRGraph) -> list[list[int]] | None:
+    """
+    Return the successive layers of a topological order if possible, and None if there is at least one cycle.
+
+    Layer 0 holds the nodes without incoming edges, and each next layer the nodes
+    whose in degree reaches 0 once the previous layers are removed. The number of
+    layers is the depth of the critical path.
+    """
+    # 1. Create graph, e.g. as adjacency list and count incoming degrees
+    graph = as_csr(n, edges)
+    offsets, targets = graph.offsets, graph.targets
+    in_degrees = [0] * n
+
+    for v in targets:
+        in_degrees[v] += 1
+
+    # 2. Traversal by waves, starting from the nodes with in degree of 0
+    layers = []
+    layer = [node for node, degree in enumerate(in_degrees) if degree == 0]
+    visited = 0
+
+    while layer:
+        layers.append(layer)
+        visited += len(layer)
+        next_layer = []
+        for node in layer:
+            for neib in targets[offsets[node] : offsets[node + 1]]:
+                in_degrees[neib] -= 1
+                if in_degrees[neib] == 0:
+                    next_layer.append(neib)
+        layer = next_layer
+
+    # Check if the length is coherent
+    return layers if visited == n else None
@@ -10,27 +10,54 @@ Algorithm:
     - Stop when all nodes belong to the same connected component or no more
         edges (if there is more than 1 single connected component).
 
+The main loop usually stops after V - 1 accepted edges, so the heaviest edges
+are often sorted for nothing. Edge selection modes:
+- "sort": sort all the edges
+- "heap": heapify the edges in O(E) and only pay O(log E) for each edge popped
+- "filter": Filter-Kruskal, quicksort-style:
+    - Partition the edges around a pivot weight
+    - Process the light half first (recursively)
+    - Then drop the heavy edges whose endpoints are already connected, and recurse on the rest
+    - Small partitions are sorted directly
+
 Complexity:
 - O(E log E) ~ O(E log V) for sorting
 - O(E a(n)) for the main loop
+- "heap": O(E + k log E) where k is the number of edges tried
+- "filter": O(E + V log V log(E / V)) expected on random graphs
 
 Tips:
 - Use a disjoint set for the main loop.
+- The selection modes are lazy generators: edges are produced while the main loop
+    consumes them, so the filter always sees the current connected components
+- "heap" and "filter" pay off on dense graphs, where most edges are never needed
 """
 
 import operator
+import random
+from collections.abc import Callable, Iterable, Iterator
+from heapq import heapify, heappop
+from typing import Literal
+
+from data_structures_and_algorithms.graph import CSRGraph
+
+FILTER_KRUSKAL_THRESHOLD = 64  # Partitions smaller than this are sorted directly
+
+type EdgeSelection = Literal["sort", "heap", "filter"]
 
 
-def kruskal[T: int | float](n: int, edges: list[tuple[int, int, T]]) -> list[tuple[int, int, T]]:
+def kruskal[T: int | float](
+    n: int, edges: list[tuple[int, int, T]] | CSRGraph, *, selection: EdgeSelection = "sort"
+) -> list[tuple[int, int, T]]:
     """
     Return the edges of a minimum spanning tree.
 
-    Edges are given as:  (u, v, w), where w is the weight.
+    Edges are given as:  (u, v, w), where w is the weight, or as a prebuilt
+    CSRGraph whose directed edges are considered undirected.
+    selection chooses how the edges are ordered: "sort" (in place for a list),
+    "heap" or "filter" (see the module documentation).
     """
-    # 1. Sort the edges
-    edges.sort(key=operator.itemgetter(2))
-
-    # 2. Implement a disjoint set
+    # 1. Implement a disjoint set
     rank = [1] * n
     parent = list(range(n))
 
@@ -60,10 +87,13 @@ def kruskal[T: int | float](n: int, edges: list[tuple[int, int, T]]) -> list[tup
 
         return True
 
+    # 2. Sort the edges, lazily for "heap" and "filter"
+    sorted_edges = _ordered_edges(edges, selection, find)
+
     # 3. Select edges
     res = []
 
-    for edge in edges:
+    for edge in sorted_edges:
         u, v, _ = edge
 
         if union(u, v):
@@ -72,3 +102,85 @@ def kruskal[T: int | float](n: int, edges: list[tuple[int, int, T]]) -> list[tup
                 return res
 
     return res
+
+
+def _ordered_edges[T: int | float](
+    edges: list[tuple[int, int, T]] | CSRGraph,
+    selection: EdgeSelection,
+    find: Callable[[int], int],
+) -> Iterable[tuple[int, int, T]]:
+    """Return the edges by increasing weight with the given selection mode."""
+    if selection == "sort":
+        return _sorted_edges(edges)
+    if selection == "heap":
+        return _heap_edges(edges)
+    return _filter_kruskal_edges(_edge_list(edges), find)
+
+
+def _edge_list[T: int | float](
+    edges: list[tuple[int, int, T]] | CSRGraph,
+) -> list[tuple[int, int, T]]:
+    """Return a copy of the edges as a list, the filter partitions it."""
+    if isinstance(edges, CSRGraph):
+        return list(edges)  # pyright: ignore[reportReturnType]
+    return list(edges)
+
+
+def _sorted_edges[T: int | float](
+    edges: list[tuple[int, int, T]] | CSRGraph,
+) -> Iterable[tuple[int, int, T]]:
+    """Return the edges by increasing weight, sorting a list in place."""
+    if not isinstance(edges, CSRGraph):
+        edges.sort(key=operator.itemgetter(2))
+        return edges
+
+    # Only sort the edge indices, tuples are built when the edges are consumed
+    sources, targets, weights = edges.sources, edges.targets, edges.weights
+    order = sorted(range(edges.num_edges), key=weights.__getitem__)
+    return ((sources[k], targets[k], weights[k]) for k in order)  # pyright: ignore[reportReturnType]
+
+
+def _heap_edges[T: int | float](
+    edges: list[tuple[int, int, T]] | CSRGraph,
+) -> Iterator[tuple[int, int, T]]:
+    """Yield the edges by increasing weight, popping them from a heap of (weight, index)."""
+    weights = edges.weights if isinstance(edges, CSRGraph) else [w for _, _, w in edges]
+    heap = [(w, k) for k, w in enumerate(weights)]
+    heapify(heap)
+
+    if isinstance(edges, CSRGraph):
+        sources, targets = edges.sources, edges.targets
+        while heap:
+            w, k = heappop(heap)
+            yield sources[k], targets[k], w  # pyright: ignore[reportReturnType]
+    else:
+        while heap:
+            yield edges[heappop(heap)[1]]
+
+
+def _filter_kruskal_edges[T: int | float](
+    edges: list[tuple[int, int, T]], find: Callable[[int], int]
+) -> Iterator[tuple[int, int, T]]:
+    """Yield the edges by increasing weight, skipping heavy edges already connected when reached."""
+    # Stack of (partition, filter): the heavy halves are filtered when they are reached
+    stack = [(edges, False)]
+    while stack:
+        part, filter_part = stack.pop()
+        if filter_part:
+            part = [edge for edge in part if find(edge[0]) != find(edge[1])]
+
+        if len(part) <= FILTER_KRUSKAL_THRESHOLD:
+            part.sort(key=operator.itemgetter(2))
+            yield from part
+            continue
+
+        pivot = random.choice(part)[2]  # noqa: S311
+        light = [edge for edge in part if edge[2] <= pivot]
+        heavy = [edge for edge in part if edge[2] > pivot]
+        if not heavy:
+            # The pivot is the maximum weight, unlucky split
+            part.sort(key=operator.itemgetter(2))
+            yield from part
+            continue
+
+        stack.extend(((heavy, True), (light, False)))
@@ -0,0 +1,215 @@
+"""
+Prim's algorithm.
+
+Return the edges forming a minimum spanning tree of a graph by growing a tree
+from a root: always add the cheapest edge linking the tree to a new node. Like
+Dijkstra, but the key of a node is the weight of its cheapest edge to the tree
+instead of its distance to the source.
+
+Use cases:
+- Minimum spanning trees of dense graphs (E ~ V^2), where Kruskal's sort of all
+    the edges is wasteful
+
+Algorithm:
+- best[v] = weight of the cheapest edge from the tree to v (inf)
+- Repeat: add the node with the lowest best to the tree (with its best edge) and
+    lower the best of its neighbors
+- Restart from a new root when the remaining nodes are unreachable (forest)
+- Dense mode (`prim_dense`): find the lowest best by scanning an array, the graph
+    is an adjacency matrix
+- Sparse mode (`prim`): indexed heap with decrease key over CSR adjacency
+- Edge list modes (`prim`, `prim_dense_edges`): the key of an edge is (w, index
+    of the edge in the input), a total order so the tree is unique, and the input
+    edges of the tree are returned sorted by key: the same list as Kruskal's with a
+    stable sort
+
+Complexity: V nodes and E edges
+- Dense (array scan): O(V^2), optimal when E ~ V^2
+- Dense from an edge list: O(V^2 + E) to build the matrix first
+- Sparse (indexed heap): O(E log V)
+
+Tips:
+- No priority queue is better than a heap for dense graphs: V scans of O(V)
+    against E ~ V^2 decrease keys of O(log V)
+- The graph is undirected: store each edge in both directions, with the index
+    of the input edge as CSR weight
+- It works for negative weights (contrary to Dijkstra, keys are not sums)
+- Take the adjacency matrix as input when it is available: building it from an
+    edge list is a Python loop over the E edges, slower than Kruskal's sort in CPython
+- Dense mode from an edge list: weights and edge indices in separate arrays, so
+    the scans compare floats and only look at the indices on ties
+"""
+
+import operator
+from collections.abc import Iterable, Sequence
+from itertools import chain
+from typing import NamedTuple
+
+from data_structures_and_algorithms.binary_heap import IndexedMinHeap
+from data_structures_and_algorithms.graph import CSRGraph
+
+INF = float("inf")
+NAN = float("nan")
+
+type _Key = tuple[float, int]  # (w, index of the input edge)
+
+NO_EDGE: _Key = (INF, -1)  # Key of a missing edge, greater than every edge key
+
+
+class AdjacencyMatrix[T: int | float](NamedTuple):
+    """Undirected graph as an adjacency matrix: rows[u][v] is the weight of (u, v), inf if none."""
+
+    rows: Sequence[Sequence[T]]
+
+    def edges(self) -> list[tuple[int, int, T]]:
+        """Return the (u, v, w) edges of the upper triangle (u < v), row by row."""
+        n = len(self.rows)
+        return [
+            (u, v, row[v])
+            for u, row in enumerate(self.rows)
+            for v in range(u + 1, n)
+            if row[v] != INF
+        ]
+
+
+def prim[T: int | float](
+    n: int, edges: Iterable[tuple[int, int, T]] | CSRGraph
+) -> list[tuple[int, int, T]]:
+    """
+    Return the edges of a minimum spanning tree, using an indexed heap, like `kruskal.kruskal`.
+
+    Edges are given as:  (u, v, w), where w is the weight, or as a prebuilt
+    CSRGraph whose directed edges are considered undirected.
+    """
+    edge_list = _edge_list(edges)
+    weights = [w for _, _, w in edge_list]
+
+    # Undirected adjacency: each edge in both directions, the CSR weights are the edge indices
+    graph = CSRGraph.from_edges(
+        n,
+        chain(
+            ((u, v, k) for k, (u, v, _) in enumerate(edge_list)),
+            ((v, u, k) for k, (u, v, _) in enumerate(edge_list)),
+        ),
+    )
+    offsets, targets, indices = graph.offsets, graph.targets, graph.weights
+
+    pq = IndexedMinHeap(n, NO_EDGE)
+    best = pq.keys
+    in_tree = [False] * n
+    tree = []
+
+    for root in range(n):
+        if in_tree[root]:
+            continue
+        pq.push(root, (-INF, -1))
+
+        while pq:
+            node = pq.pop()
+            in_tree[node] = True
+            if best[node][1] != -1:
+                tree.append(best[node])
+
+            for i in range(offsets[node], offsets[node + 1]):
+                neib, k = targets[i], int(indices[i])
+                key: _Key = (weights[k], k)
+                if in_tree[neib] or not key < best[neib]:
+                    continue
+                if neib in pq:
+                    pq.decrease_key(neib, key)
+                else:
+                    pq.push(neib, key)
+
+    tree.sort()
+    return [edge_list[k] for _, k in tree]
+
+
+def prim_dense[T: int | float](matrix: Sequence[Sequence[T]]) -> list[tuple[int, int, T]]:
+    """
+    Return the edges of a minimum spanning tree of a graph given as an adjacency matrix.
+
+    matrix[u][v] is the weight of the undirected edge (u, v), inf if there is no
+    edge. Tree edges are returned as (u, v, w) with u < v, by increasing weight.
+    """
+    n = len(matrix)
+    best: list[float] = [INF] * n
+    parent = [-1] * n
+    remaining = list(range(n))
+    res = []
+
+    while remaining:
+        # Array scan for the cheapest node, a new root if it is unreachable
+        node = min(remaining, key=best.__getitem__)
+        remaining.remove(node)
+        if parent[node] != -1:
+            u, v = sorted((parent[node], node))
+            res.append((u, v, matrix[u][v]))
+
+        row = matrix[node]
+        for neib in remaining:
+            if row[neib] < best[neib]:
+                best[neib] = row[neib]
+                parent[neib] = node
+
+    res.sort(key=operator.itemgetter(2))
+    return res
+
+
+def prim_dense_edges[T: int | float](
+    n: int, edges: Iterable[tuple[int, int, T]] | CSRGraph
+) -> list[tuple[int, int, T]]:
+    """
+    Return the edges of a minimum spanning tree, using array scans, like `kruskal.kruskal`.
+
+    Edges are given as:  (u, v, w), where w is the weight, or as a prebuilt
+    CSRGraph whose directed edges are considered undirected. The adjacency
+    matrix of the cheapest edge between each pair of nodes takes O(V^2) memory.
+    """
+    # Adjacency matrix of the cheapest edge between each pair: weight and input index
+    edge_list = _edge_list(edges)
+    weight: list[list[float]] = [[INF] * n for _ in range(n)]
+    index = [[-1] * n for _ in range(n)]
+    for k, (u, v, w) in enumerate(edge_list):
+        if w < weight[u][v]:  # Strict: the first parallel edge wins the ties
+            weight[u][v] = weight[v][u] = w
+            index[u][v] = index[v][u] = k
+
+    best_w: list[float] = [INF] * n
+    best_k = [-1] * n
+    remaining = list(range(n))
+    tree: list[_Key] = []
+
+    while remaining:
+        node = _cheapest(remaining, best_w, best_k)
+        remaining.remove(node)
+        if best_k[node] != -1:
+            tree.append((best_w[node], best_k[node]))
+        best_w[node] = NAN  # Never equal to the weight of a remaining node
+
+        row_w, row_k = weight[node], index[node]
+        for neib in remaining:
+            w = row_w[neib]
+            if w <= best_w[neib] and (w < best_w[neib] or row_k[neib] < best_k[neib]):
+                best_w[neib] = w
+                best_k[neib] = row_k[neib]
+
+    tree.sort()
+    return [edge_list[k] for _, k in tree]
+
+
+def _edge_list[T: int | float](
+    edges: Iterable[tuple[int, int, T]] | CSRGraph,
+) -> list[tuple[int, int, T]]:
+    """Return the edges as a list indexed like in `kruskal.kruskal` (CSR order for a CSRGraph)."""
+    if isinstance(edges, CSRGraph):
+        return list(edges)  # pyright: ignore[reportReturnType]
+    return list(edges)
+
+
+def _cheapest(remaining: list[int], best_w: list[float], best_k: list[int]) -> int:
+    """Return the remaining node with the lowest key, comparing the edge indices only on ties."""
+    node = min(remaining, key=best_w.__getitem__)
+    w = best_w[node]
+    if best_w.count(w) > 1:
+        node = min((v for v in remaining if best_w[v] == w), key=best_k.__getitem__)
+    return node
@@ -0,0 +1,135 @@
+"""
+Strongly connected components (Tarjan's algorithm) and condensation.
+
+A strongly connected component (SCC) is a maximal set of nodes that can all
+reach each other. Every cycle is inside one SCC, so the SCCs tell exactly which
+nodes form cycles, where Khan's algorithm only says that there is one.
+
+Use cases:
+- Cycle diagnostics in dependency graphs: the SCCs with more than one node (or a self loop)
+- Condensation: contracting each SCC to a single node gives a DAG, that can then
+    be processed in topological order (2-SAT, reachability, ...)
+
+Algorithm (iterative DFS, no recursion limit):
+- index[node]: DFS discovery order, low[node]: lowest index reachable from the
+    DFS subtree of node through at most one back edge to a node still on the stack
+- Push each discovered node on the SCC stack
+- Edge to an undiscovered node: recurse (push a frame), then low[node] = min(low[node], low[neib])
+- Edge to a node on the stack: low[node] = min(low[node], index[neib])
+- When a node is finished with low == index, it is the root of an SCC: pop the
+    SCC stack down to it
+
+Complexity: V nodes and E edges
+- O(V + E), one DFS
+
+Tips:
+- Tarjan finds the SCCs in reverse topological order of the condensation (an SCC
+    is only completed after all the SCCs it can reach): reverse it for a topological order
+- Iterative DFS: the frames are (node, next edge position), the edge loop resumes
+    where it stopped after returning from a child
+"""
+
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from data_structures_and_algorithms.graph import CSRGraph, as_csr
+
+
+class Condensation(NamedTuple):
+    """SCCs of a graph and the DAG of the SCCs."""
+
+    components: list[list[int]]  # Nodes of each SCC, in reverse topological order
+    component_of: list[int]  # SCC index of each node
+    edges: list[tuple[int, int]]  # Edges between different SCCs, deduplicated and sorted
+    order: list[int]  # Topological order of the SCC indices
+
+
+def tarjan_scc(n: int, edges: Iterable[tuple[int, int]] | CSRGraph) -> list[list[int]]:
+    """Return the strongly connected components, in reverse topological order of the condensation."""
+    graph = as_csr(n, edges)
+    offsets, targets = graph.offsets, graph.targets
+
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack = []
+    components = []
+    counter = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        frames = [(root, offsets[root])]  # node, next edge position
+
+        while frames:
+            node, k = frames[-1]
+            if k < offsets[node + 1]:
+                # Next edge
+                frames[-1] = (node, k + 1)
+                neib = targets[k]
+                if index[neib] == -1:
+                    index[neib] = low[neib] = counter
+                    counter += 1
+                    stack.append(neib)
+                    on_stack[neib] = True
+                    frames.append((neib, offsets[neib]))
+                elif on_stack[neib]:
+                    low[node] = min(low[node], index[neib])
+                continue
+
+            # Node finished: propagate low to the parent, pop the SCC if node is its root
+            frames.pop()
+            if frames:
+                parent = frames[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                components.append(_pop_component(stack, on_stack, node))
+
+    return components
+
+
+def _pop_component(stack: list[int], on_stack: list[bool], root: int) -> list[int]:
+    """Pop and return the nodes of the SCC stack down to the root of the SCC."""
+    component = []
+    while True:
+        member = stack.pop()
+        on_stack[member] = False
+        component.append(member)
+        if member == root:
+            return component
+
+
+def condensation(n: int, edges: Iterable[tuple[int, int]] | CSRGraph) -> Condensation:
+    """Return the SCCs of the graph, the condensation DAG and its topological order."""
+    graph = as_csr(n, edges)
+    components = tarjan_scc(n, graph)
+
+    component_of = [0] * n
+    for i, component in enumerate(components):
+        for node in component:
+            component_of[node] = i
+
+    dag_edges = {
+        (component_of[u], component_of[v])
+        for u, v, _ in graph
+        if component_of[u] != component_of[v]
+    }
+    order = list(reversed(range(len(components))))
+
+    return Condensation(components, component_of, sorted(dag_edges), order)
+
+
+def find_cycles(n: int, edges: Iterable[tuple[int, int]] | CSRGraph) -> list[list[int]]:
+    """Return the SCCs containing a cycle: more than one node, or a self loop."""
+    graph = as_csr(n, edges)
+    offsets, targets = graph.offsets, graph.targets
+    return [
+        component
+        for component in tarjan_scc(n, graph)
+        if len(component) > 1
+        or component[0] in targets[offsets[component[0]] : offsets[component[0] + 1]]
+    ]
@@ -0,0 +1,125 @@
+"""
+Yen's algorithm.
+
+Find the k shortest loopless paths from a source to a destination, in order of
+length: the shortest path, then the best alternative routes.
+
+Use cases:
+- Alternative routes, backup paths in networks
+- Ranking paths when the shortest one might violate a constraint checked afterwards
+
+Algorithm:
+- A = [shortest path] (Dijkstra), B = heap of candidate paths
+- To find path k + 1, for each spur node (every node of path k except dest):
+    - Root = path k from src to the spur node
+    - Mask the edge following the root in every path of A sharing this root
+        (those deviations are already known)
+    - Mask the nodes of the root except the spur node (to stay loopless)
+    - Spur path = Dijkstra from the spur node to dest in the masked graph
+    - Push root + spur path in B if it is new
+- Path k + 1 is the shortest candidate of B
+
+Complexity: V nodes, E edges, L the number of nodes of the paths
+- O(k * L * (E log V)): one Dijkstra per spur node for each path
+
+Tips:
+- No copy of the graph for each spur: the masks are applied by the neighbors
+    callback of `dijkstra_implicit`
+- Keep A and B between calls: asking for k + 1 paths after k only runs the spur
+    searches of path k
+- Deduplicate the candidates, the same path can be found from different spur nodes
+"""
+
+from collections.abc import Iterable, Iterator
+from heapq import heappop, heappush
+from itertools import pairwise
+
+from data_structures_and_algorithms.dijkstra import dijkstra, dijkstra_implicit
+from data_structures_and_algorithms.graph import CSRGraph, as_csr
+
+
+class KShortestPaths:
+    """Shortest loopless paths from src to dest, computed lazily in order of length."""
+
+    def __init__(
+        self, n: int, edges: Iterable[tuple[int, int, float]] | CSRGraph, src: int, dest: int
+    ) -> None:
+        self.graph: CSRGraph = as_csr(n, edges)
+        self.src: int = src
+        self.dest: int = dest
+        self.paths: list[tuple[float, list[int]]] = []  # A: found paths, (length, nodes)
+        self.candidates: list[tuple[float, list[int]]] = []  # B: heap of candidates
+        self._seen: set[tuple[int, ...]] = set()
+        self._num_spurred: int = 0  # Number of found paths whose deviations are in the candidates
+
+        path = dijkstra(n, self.graph, src, dest) if n else None
+        if path is not None:
+            self._push_candidate(path)
+
+    def __iter__(self) -> Iterator[tuple[float, list[int]]]:
+        """Yield the (length, path) of the shortest paths in order, from the first one."""
+        k = 0
+        while True:
+            if k == len(self.paths) and not self._next_path():
+                return
+            yield self.paths[k]
+            k += 1
+
+    def k_shortest(self, k: int) -> list[tuple[float, list[int]]]:
+        """Return the (length, path) of the k shortest paths (fewer if there are not k paths)."""
+        while len(self.paths) < k and self._next_path():
+            pass
+        return self.paths[:k]
+
+    def _next_path(self) -> bool:
+        """Find the next shortest path, return False if there is none."""
+        if self._num_spurred < len(self.paths):
+            self._spur_candidates(self.paths[-1][1])
+            self._num_spurred += 1
+        if not self.candidates:
+            return False
+        self.paths.append(heappop(self.candidates))
+        return True
+
+    def _spur_candidates(self, last_path: list[int]) -> None:
+        """Push the deviations of the last found path to the candidates."""
+        for i, spur in enumerate(last_path[:-1]):
+            root = last_path[: i + 1]
+            masked_edges = {
+                (path[i], path[i + 1]) for _, path in self.paths if path[: i + 1] == root
+            }
+            masked_nodes = set(root[:-1])
+
+            def neighbors(
+                node: int,
+                masked_edges: set[tuple[int, int]] = masked_edges,
+                masked_nodes: set[int] = masked_nodes,
+            ) -> Iterator[tuple[int, float]]:
+                for neib, weight in self.graph.neighbors(node):
+                    if neib not in masked_nodes and (node, neib) not in masked_edges:
+                        yield neib, weight
+
+            spur_path = dijkstra_implicit(spur, self.dest, neighbors)
+            if spur_path is not None:
+                self._push_candidate(root[:-1] + spur_path)
+
+    def _push_candidate(self, path: list[int]) -> None:
+        key = tuple(path)
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        heappush(self.candidates, (self._length(path), path))
+
+    def _length(self, path: list[int]) -> float:
+        """Return the length of the path, with the lightest of parallel edges."""
+        return sum(
+            min(weight for neib, weight in self.graph.neighbors(u) if neib == v)
+            for u, v in pairwise(path)
+        )
+
+
+def k_shortest_paths(
+    n: int, edges: Iterable[tuple[int, int, float]] | CSRGraph, src: int, dest: int, k: int
+) -> list[list[int]]:
+    """Return the k shortest loopless paths from src to dest (fewer if there are not k paths)."""
+    return [path for _, path in KShortestPaths(n, edges, src, dest).k_shortest(k)]
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from data_structures_and_algorithms.a_star import a_star, euclidean_heuristic, manhattan_heuristic
+from data_structures_and_algorithms.dijkstra import dijkstra
+
+
+def grid_graph(width: int, height: int, walls: frozenset[tuple[int, int]] = frozenset()):
+    """Return the edges and coordinates of a 4-connected grid with unit weights."""
+    coords = [(x, y) for y in range(height) for x in range(width)]
+    edges = []
+    for x, y in coords:
+        if (x, y) in walls:
+            continue
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < width and 0 <= ny < height and (nx, ny) not in walls:
+                edges.append((y * width + x, ny * width + nx, 1))
+    return edges, coords
+
+
+def test_simple_graph():
+    edges = [(0, 1, 1), (1, 2, 2), (0, 2, 4)]
+    assert a_star(3, edges, 0, 2, lambda _: 0) == [0, 1, 2]
+
+
+def test_no_path():
+    edges = [(0, 1, 1), (2, 3, 1)]
+    assert a_star(4, edges, 0, 3, lambda _: 0) is None
+
+
+def test_empty_graph():
+    assert a_star(0, [], 0, 0, lambda _: 0) is None
+
+
+def test_source_equals_destination():
+    assert a_star(3, [(0, 1, 1), (1, 2, 1)], 0, 0, lambda _: 0) == [0]
+
+
+@pytest.mark.parametrize("heuristic", ["coords", "euclidean", "manhattan"])
+def test_grid_with_walls(heuristic):
+    width = 6
+    walls = frozenset({(2, 0), (2, 1), (2, 2), (2, 3)})
+    edges, coords = grid_graph(width, 5, walls)
+    src, dest = 0, 5  # (0, 0) -> (5, 0), around the wall
+    h = {
+        "coords": coords,
+        "euclidean": euclidean_heuristic(coords, dest),
+        "manhattan": manhattan_heuristic(coords, dest),
+    }[heuristic]
+
+    path = a_star(len(coords), edges, src, dest, h)
+    assert path is not None
+    assert path[0] == src
+    assert path[-1] == dest
+    assert len(path) == len(dijkstra(len(coords), edges, src, dest) or [])
+    assert all((coords[node][0], coords[node][1]) not in walls for node in path)
+
+
+def test_inconsistent_admissible_heuristic():
+    # h(1) = 2 is the true distance from 1 to 4 (admissible), but more than
+    # w(1, 3) + h(3) = 1 (inconsistent): the f values popped are not monotonic
+    edges = [(0, 1, 1), (0, 2, 1), (1, 3, 1), (2, 1, 1), (1, 4, 5), (3, 4, 1)]
+    h = [0, 2, 0, 0, 0].__getitem__
+    assert a_star(5, edges, 0, 4, h) == dijkstra(5, edges, 0, 4) == [0, 1, 3, 4]
+
+
+def test_matches_dijkstra_random_geometric_graphs():
+    rng = random.Random(0)
+    for _ in range(20):
+        n = 30
+        coords = [(rng.random(), rng.random()) for _ in range(n)]
+        edges = []
+        for _ in range(4 * n):
+            u, v = rng.randrange(n), rng.randrange(n)
+            dist = ((coords[u][0] - coords[v][0]) ** 2 + (coords[u][1] - coords[v][1]) ** 2) ** 0.5
+            edges.append((u, v, dist * rng.uniform(1, 2)))
+        expected = dijkstra(n, edges, 0, n - 1)
+        assert a_star(n, edges, 0, n - 1, coords) == expected
@@ -0,0 +1,62 @@
+import random
+from array import array
+
+import pytest
+
+from data_structures_and_algorithms.all_pairs import (
+    all_pairs_shortest_path_trees,
+    all_pairs_shortest_paths,
+    write_distance_matrix,
+)
+from data_structures_and_algorithms.dijkstra import INF, dijkstra_all
+from data_structures_and_algorithms.graph import CSRGraph
+
+
+@pytest.fixture(scope="module")
+def random_graph():
+    rng = random.Random(0)
+    n = 40
+    edges = [(rng.randrange(n), rng.randrange(n), rng.uniform(0, 10)) for _ in range(120)]
+    return n, edges
+
+
+def test_rows_match_dijkstra(random_graph):
+    n, edges = random_graph
+    rows = dict(all_pairs_shortest_paths(n, edges, max_workers=2, chunk_size=7))
+    assert sorted(rows) == list(range(n))
+    for src, row in rows.items():
+        assert list(row) == dijkstra_all(n, edges, src)[0]
+
+
+def test_trees_match_dijkstra(random_graph):
+    n, edges = random_graph
+    trees = {
+        src: (dist, prev)
+        for src, dist, prev in all_pairs_shortest_path_trees(n, edges, max_workers=2, chunk_size=7)
+    }
+    assert sorted(trees) == list(range(n))
+    for src, (dist, prev) in trees.items():
+        assert (list(dist), list(prev)) == dijkstra_all(n, edges, src)
+
+
+def test_small_graph_with_csr_input():
+    graph = CSRGraph.from_edges(3, [(0, 1, 1), (1, 2, 2), (0, 2, 4)])
+    rows = dict(all_pairs_shortest_paths(3, graph, max_workers=1))
+    assert list(rows[0]) == [0, 1, 3]
+    assert list(rows[1]) == [INF, 0, 2]
+    assert list(rows[2]) == [INF, INF, 0]
+
+
+def test_empty_graph():
+    assert list(all_pairs_shortest_paths(0, [], max_workers=1)) == []
+
+
+def test_write_distance_matrix(tmp_path, random_graph):
+    n, edges = random_graph
+    path = tmp_path / "matrix.bin"
+    write_distance_matrix(n, edges, path, max_workers=2, chunk_size=5)
+
+    matrix = array("d", path.read_bytes())
+    assert len(matrix) == n * n
+    for src in range(n):
+        assert list(matrix[src * n : (src + 1) * n]) == dijkstra_all(n, edges, src)[0]
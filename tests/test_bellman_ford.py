@@ -1,4 +1,8 @@
-from data_structures_and_algorithms.bellman_ford import bellman_ford, bellman_ford_opti
+import random
+
+import pytest
+
+from data_structures_and_algorithms.bellman_ford import bellman_ford, bellman_ford_opti, spfa
 
 INF = float("inf")
 
@@ -75,3 +79,65 @@ def test_bellman_ford_opti_negative_cycle_unreachable():
     assert dist[2] == INF
     assert dist[3] == INF
     assert pred == [-1, 0, -1, -1]
+
+
+@pytest.mark.parametrize(
+    ("slf", "lll"), [(False, False), (True, False), (False, True), (True, True)]
+)
+class TestSPFA:
+    def test_simple_graph(self, slf, lll):
+        edges = [(0, 1, 1), (0, 2, 4), (1, 2, 2)]
+        assert spfa(3, edges, 0, slf=slf, lll=lll) == ([0, 1, 3], [-1, 0, 1])
+
+    def test_negative_edge_no_cycle(self, slf, lll):
+        edges = [(0, 1, -1), (1, 2, 2)]
+        assert spfa(3, edges, 0, slf=slf, lll=lll) == ([0, -1, 1], [-1, 0, 1])
+
+    def test_negative_cycle_unreachable(self, slf, lll):
+        edges = [(0, 1, 1), (2, 3, 1), (3, 2, -3)]
+        assert spfa(4, edges, 0, slf=slf, lll=lll) == ([0, 1, INF, INF], [-1, 0, -1, -1])
+
+    def test_returns_cycle(self, slf, lll):
+        edges = [(0, 1, 2), (1, 2, 1), (2, 0, -4)]
+        dist, cycle = spfa(3, edges, 0, slf=slf, lll=lll)
+        assert dist is None
+        assert set(cycle) == {0, 1, 2}
+
+    def test_negative_self_loop(self, slf, lll):
+        dist, cycle = spfa(2, [(0, 1, 1), (1, 1, -1)], 0, slf=slf, lll=lll)
+        assert dist is None
+        assert cycle == [1]
+
+    def test_random_graphs_match_bellman_ford(self, slf, lll):
+        rng = random.Random(0)
+        for _ in range(100):
+            n = rng.randint(1, 15)
+            edges = [
+                (rng.randrange(n), rng.randrange(n), rng.randint(-3, 10))
+                for _ in range(rng.randint(0, 3 * n))
+            ]
+            expected_dist, _ = bellman_ford_opti(n, edges, 0)
+            dist, res = spfa(n, edges, 0, slf=slf, lll=lll)
+            assert dist == expected_dist
+            if dist is None:
+                # The cycle is made of edges of the graph and is negative
+                weights = {}
+                for u, v, w in edges:
+                    weights[u, v] = min(w, weights.get((u, v), INF))
+                cycle_edges = list(zip(res, res[1:] + res[:1], strict=True))
+                assert all(edge in weights for edge in cycle_edges)
+                assert sum(weights[edge] for edge in cycle_edges) < 0
+
+
+def test_detect_dag(capsys):
+    edges = [(0, 1, 2), (0, 2, 5), (1, 2, -4), (2, 3, 1)]
+    assert bellman_ford(4, edges, 0, detect_dag=True) == bellman_ford(4, edges, 0)
+    assert bellman_ford_opti(4, edges, 0, detect_dag=True) == ([0, 2, -2, -1], [-1, 0, 1, 2])
+
+    # Cycles fall back to the regular algorithm
+    cyclic_edges = [(0, 1, 1), (1, 2, -1), (2, 3, -1), (3, 1, -1)]
+    assert bellman_ford(4, cyclic_edges, 0, detect_dag=True) is None
+    dist, cycle = bellman_ford_opti(4, cyclic_edges, 0, detect_dag=True)
+    assert dist is None
+    assert set(cycle) == {1, 2, 3}
+    assert not capsys.readouterr().out
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from data_structures_and_algorithms.bellman_ford import bellman_ford_opti
+from data_structures_and_algorithms.bellman_ford_numpy import (
+    EdgeArrays,
+    bellman_ford_numpy,
+)
+from data_structures_and_algorithms.graph import CSRGraph
+
+INF = float("inf")
+
+
+def test_simple_graph():
+    edges = [(0, 1, 1), (0, 2, 4), (1, 2, 2)]
+    assert bellman_ford_numpy(3, edges, 0) == ([0, 1, 3], [-1, 0, 1])
+
+
+def test_negative_edge_no_cycle():
+    edges = [(0, 1, -1), (1, 2, 2)]
+    assert bellman_ford_numpy(3, edges, 0) == ([0, -1, 1], [-1, 0, 1])
+
+
+def test_negative_cycle_unreachable():
+    edges = [(0, 1, 1), (2, 3, 1), (3, 2, -3)]
+    assert bellman_ford_numpy(4, edges, 0) == ([0, 1, INF, INF], [-1, 0, -1, -1])
+
+
+def test_returns_cycle():
+    edges = [(0, 1, 2), (1, 2, 1), (2, 0, -4)]
+    dist, cycle = bellman_ford_numpy(3, edges, 0)
+    assert dist is None
+    assert set(cycle) == {0, 1, 2}
+
+
+def test_no_edges():
+    assert bellman_ford_numpy(2, [], 1) == ([INF, 0], [-1, -1])
+
+
+def test_input_formats():
+    edges = [(0, 1, 2), (1, 2, 2), (0, 2, 5), (1, 3, 1), (2, 3, 3)]
+    expected = bellman_ford_opti(4, edges, 0)
+    assert bellman_ford_numpy(4, CSRGraph.from_edges(4, edges), 0) == expected
+    arrays = EdgeArrays(
+        np.array([0, 1, 0, 1, 2]), np.array([1, 2, 2, 3, 3]), np.array([2.0, 2, 5, 1, 3])
+    )
+    assert bellman_ford_numpy(4, arrays, 0) == expected
+
+
+def test_random_graphs_match_bellman_ford():
+    rng = random.Random(0)
+    for _ in range(100):
+        n = rng.randint(1, 15)
+        edges = [
+            (rng.randrange(n), rng.randrange(n), rng.randint(-3, 10))
+            for _ in range(rng.randint(0, 3 * n))
+        ]
+        expected_dist, _ = bellman_ford_opti(n, edges, 0)
+        dist, res = bellman_ford_numpy(n, edges, 0)
+        assert dist == expected_dist
+        weights = {}
+        for u, v, w in edges:
+            weights[u, v] = min(w, weights.get((u, v), INF))
+        if dist is None:
+            cycle_edges = list(zip(res, res[1:] + res[:1], strict=True))
+            assert sum(weights[edge] for edge in cycle_edges) < 0
+        else:
+            # Predecessors are consistent with the distances
+            for node, pred in enumerate(res):
+                if pred != -1:
+                    assert dist[pred] + weights[pred, node] == dist[node]
@@ -2,7 +2,7 @@ from heapq import heapify, heappop, heappush
 
 import pytest
 
-from data_structures_and_algorithms.binary_heap import MinHeap
+from data_structures_and_algorithms.binary_heap import IndexedMinHeap, MinHeap
 
 
 @pytest.fixture
@@ -134,3 +134,39 @@ def test_heapify_against_stdlib(heap_test_case):
         std_heap.pop()
         if std_heap:
             heapify(std_heap)
+
+
+def test_indexed_heap_pop_order():
+    keys = [5.0, 3.0, 8.0, 1.0, 4.0]
+    heap = IndexedMinHeap(len(keys))
+    for item, key in enumerate(keys):
+        heap.push(item, key)
+    assert len(heap) == 5
+    assert [heap.pop() for _ in keys] == [3, 1, 4, 0, 2]
+    assert len(heap) == 0
+
+
+def test_indexed_heap_decrease_key():
+    heap = IndexedMinHeap(4)
+    for item, key in enumerate([4, 3, 2, 1]):
+        heap.push(item, key)
+    heap.decrease_key(0, 0)
+    assert 0 in heap
+    assert heap.pop() == 0
+    assert 0 not in heap
+    assert heap.keys[0] == 0
+    heap.decrease_key(2, -1)
+    assert [heap.pop() for _ in range(3)] == [2, 3, 1]
+
+
+def test_indexed_heap_positions():
+    heap = IndexedMinHeap(50)
+    keys = [(i * 37) % 50 for i in range(50)]
+    for item, key in enumerate(keys):
+        heap.push(item, key)
+    for item in range(0, 50, 3):
+        heap.decrease_key(item, heap.keys[item] - 25)
+    for _ in range(10):
+        heap.pop()
+    assert all(heap.heap[heap.pos[item]] == item for item in heap.heap)
+    assert _is_min_heap([heap.keys[item] for item in heap.heap])
@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from data_structures_and_algorithms.boruvka import boruvka
+from data_structures_and_algorithms.graph import CSRGraph
+from data_structures_and_algorithms.kruskal import kruskal
+from data_structures_and_algorithms.mst import minimum_spanning_tree
+
+
+def test_triangle():
+    edges = [(0, 1, 1.0), (1, 2, 1.0), (0, 2, 2.0)]
+    assert boruvka(3, edges) == [(0, 1, 1.0), (1, 2, 1.0)]
+
+
+def test_empty_and_disconnected():
+    assert boruvka(0, []) == []
+    assert boruvka(3, []) == []
+    assert boruvka(4, [(0, 1, 2), (2, 3, 1), (3, 3, 0)]) == [(2, 3, 1), (0, 1, 2)]
+
+
+def test_csr_input_keeps_weight_type():
+    graph = CSRGraph.from_edges(3, [(0, 1, 5), (1, 2, 3), (2, 0, 4)])
+    mst = boruvka(3, graph)
+    assert mst == [(1, 2, 3), (2, 0, 4)]
+    assert all(isinstance(w, int) for _, _, w in mst)
+
+
+def test_random_graphs_match_kruskal():
+    rng = random.Random(0)
+    for _ in range(50):
+        n = rng.randint(1, 80)
+        # Few distinct weights: many ties
+        edges = [(rng.randrange(n), rng.randrange(n), rng.randint(0, 5)) for _ in range(3 * n)]
+        assert boruvka(n, edges) == kruskal(n, list(edges))
+        graph = CSRGraph.from_edges(n, edges)
+        assert boruvka(n, graph) == kruskal(n, graph)
+
+
+def test_front_door_boruvka():
+    edges = [(0, 1, 1.0), (1, 2, 1.0), (0, 2, 2.0)]
+    assert minimum_spanning_tree(3, list(edges), engine="boruvka") == minimum_spanning_tree(
+        3, list(edges)
+    )
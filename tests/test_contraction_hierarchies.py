@@ -0,0 +1,94 @@
+import random
+from itertools import pairwise
+
+import pytest
+
+from data_structures_and_algorithms.contraction_hierarchies import ContractionHierarchy
+from data_structures_and_algorithms.dijkstra import dijkstra
+
+
+def path_length(edges, path):
+    weights = {}
+    for u, v, w in edges:
+        weights[u, v] = min(w, weights.get((u, v), float("inf")))
+    return sum(weights[u, v] for u, v in pairwise(path))
+
+
+def random_graph(rng, n, m, weight):
+    return [(rng.randrange(n), rng.randrange(n), weight()) for _ in range(m)]
+
+
+def assert_same_as_dijkstra(ch, n, edges, queries):
+    for src, dest in queries:
+        expected = dijkstra(n, edges, src, dest)
+        result = ch.query(src, dest)
+        if expected is None:
+            assert result is None
+        else:
+            assert result is not None
+            assert result[0] == src
+            assert result[-1] == dest
+            assert path_length(edges, result) == path_length(edges, expected)
+
+
+def test_simple_graph():
+    edges = [(0, 1, 1), (1, 2, 2), (0, 2, 4)]
+    ch = ContractionHierarchy.build(3, edges)
+    assert ch.query(0, 2) == [0, 1, 2]
+    assert ch.query(2, 0) is None
+    assert ch.query(1, 1) == [1]
+
+
+def test_empty_graph():
+    assert ContractionHierarchy.build(0, []).query(0, 0) is None
+
+
+def test_chain_unpacks_shortcuts():
+    n = 50
+    edges = [(i, i + 1, 1) for i in range(n - 1)]
+    ch = ContractionHierarchy.build(n, edges)
+    assert ch.query(0, n - 1) == list(range(n))
+    assert ch.query(10, 20) == list(range(10, 21))
+
+
+def test_random_graphs_match_dijkstra():
+    rng = random.Random(0)
+    for _ in range(20):
+        n = rng.randint(2, 40)
+        edges = random_graph(rng, n, rng.randint(0, 4 * n), lambda: rng.randint(0, 10))
+        ch = ContractionHierarchy.build(n, edges)
+        queries = [(rng.randrange(n), rng.randrange(n)) for _ in range(20)]
+        assert_same_as_dijkstra(ch, n, edges, queries)
+
+
+def test_small_witness_limit_stays_exact():
+    rng = random.Random(1)
+    n = 60
+    edges = random_graph(rng, n, 240, lambda: rng.uniform(0, 5))
+    ch = ContractionHierarchy.build(n, edges, witness_limit=1)
+    queries = [(rng.randrange(n), rng.randrange(n)) for _ in range(50)]
+    assert_same_as_dijkstra(ch, n, edges, queries)
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_save_and_load(tmp_path, use_mmap):
+    rng = random.Random(2)
+    n = 40
+    edges = random_graph(rng, n, 150, lambda: rng.uniform(0, 5))
+    ch = ContractionHierarchy.build(n, edges)
+    path = tmp_path / "graph.ch"
+    ch.save(path)
+
+    loaded = ContractionHierarchy.load(path, use_mmap=use_mmap)
+    assert loaded.n == n
+    assert list(loaded.rank) == list(ch.rank)
+    assert list(loaded.up) == list(ch.up)
+    queries = [(rng.randrange(n), rng.randrange(n)) for _ in range(30)]
+    assert all(loaded.query(src, dest) == ch.query(src, dest) for src, dest in queries)
+
+
+def test_load_invalid_file(tmp_path):
+    path = tmp_path / "graph.ch"
+    path.write_bytes(bytes(64))
+    with pytest.raises(ValueError, match="not a contraction hierarchy"):
+        ContractionHierarchy.load(path)
@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import (
+    CancelledError,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import partial
+
+import pytest
+
+from data_structures_and_algorithms.dag_executor import run_dag, run_dag_async
+
+# Diamond with a tail: 0 -> (1, 2) -> 3 -> 4, and an independent task 5
+EDGES = [(0, 1), (0, 2), (1, 3), (2, 3), (3, 4)]
+
+
+def record(log, node):
+    log.append(node)
+    return node * 10
+
+
+def fail():
+    msg = "boom"
+    raise RuntimeError(msg)
+
+
+def square(x):
+    return x * x
+
+
+def assert_dependencies_respected(log):
+    for u, v in EDGES:
+        assert log.index(u) < log.index(v)
+
+
+def test_thread_pool():
+    log = []
+    tasks = [partial(record, log, node) for node in range(6)]
+    with ThreadPoolExecutor(4) as executor:
+        run = run_dag(tasks, EDGES, executor)
+    assert run.results == {node: node * 10 for node in range(6)}
+    assert run.errors == {}
+    assert run.cancelled == set()
+    assert_dependencies_respected(log)
+
+
+def test_process_pool():
+    tasks = [partial(square, node) for node in range(6)]
+    with ProcessPoolExecutor(2) as executor:
+        run = run_dag(tasks, EDGES, executor, max_in_flight=2)
+    assert run.results == {node: node * node for node in range(6)}
+
+
+def test_failure_cancels_descendants():
+    log = []
+    tasks = [fail if node == 1 else partial(record, log, node) for node in range(6)]
+    with ThreadPoolExecutor(2) as executor:
+        run = run_dag(tasks, EDGES, executor)
+    assert set(run.results) == {0, 2, 5}
+    assert isinstance(run.errors[1], RuntimeError)
+    assert run.cancelled == {3, 4}
+    assert sorted(log) == [0, 2, 5]
+
+
+def test_max_in_flight():
+    lock = threading.Lock()
+    in_flight = [0, 0]  # current, maximum
+
+    def task():
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+
+    with ThreadPoolExecutor(8) as executor:
+        run = run_dag([task] * 8, [], executor, max_in_flight=3)
+    assert len(run.results) == 8
+    assert in_flight[1] == 3
+
+
+@pytest.mark.parametrize("max_in_flight", [0, -1])
+def test_invalid_max_in_flight(max_in_flight):
+    with ThreadPoolExecutor(1) as executor, pytest.raises(ValueError, match="max_in_flight"):
+        run_dag([lambda: 1], [], executor, max_in_flight=max_in_flight)
+    with pytest.raises(ValueError, match="max_in_flight"):
+        asyncio.run(run_dag_async([], [], max_in_flight=max_in_flight))
+
+
+def test_cancelled_future():
+    class CancellingExecutor(Executor):
+        def submit(self, _fn, /, *_args, **_kwargs):
+            # Cancelled before running, like a pool shut down with cancel_futures
+            future = Future()
+            future.cancel()
+            future.set_running_or_notify_cancel()
+            return future
+
+    run = run_dag([lambda: 1] * 6, EDGES, CancellingExecutor())
+    assert set(run.errors) == {0, 5}
+    assert all(isinstance(error, CancelledError) for error in run.errors.values())
+    assert run.cancelled == {1, 2, 3, 4}
+
+
+def test_cycle():
+    with ThreadPoolExecutor(1) as executor, pytest.raises(ValueError, match="cycle"):
+        run_dag([lambda: 1] * 2, [(0, 1), (1, 0)], executor)
+
+
+def test_asyncio():
+    log = []
+
+    async def task(node):
+        await asyncio.sleep(0.001 * (6 - node))
+        log.append(node)
+        if node == 2:
+            msg = "boom"
+            raise RuntimeError(msg)
+        return node
+
+    tasks = [partial(task, node) for node in range(6)]
+    run = asyncio.run(run_dag_async(tasks, EDGES, max_in_flight=2))
+    assert run.results == {0: 0, 1: 1, 5: 5}
+    assert set(run.errors) == {2}
+    assert run.cancelled == {3, 4}
+    assert sorted(log) == [0, 1, 2, 5]
+
+
+def test_asyncio_cancelled_task():
+    async def task(node):
+        await asyncio.sleep(0)
+        if node == 1:
+            raise asyncio.CancelledError
+        return node
+
+    tasks = [partial(task, node) for node in range(6)]
+    run = asyncio.run(run_dag_async(tasks, EDGES))
+    assert run.results == {0: 0, 2: 2, 5: 5}
+    assert isinstance(run.errors[1], asyncio.CancelledError)
+    assert run.cancelled == {3, 4}
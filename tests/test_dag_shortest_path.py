@@ -0,0 +1,59 @@
+import random
+
+from data_structures_and_algorithms.bellman_ford import bellman_ford_opti
+from data_structures_and_algorithms.dag_shortest_path import critical_path, dag_shortest_paths
+from data_structures_and_algorithms.graph import CSRGraph
+
+INF = float("inf")
+
+EDGES = [
+    (0, 1, 5),
+    (0, 2, 3),
+    (1, 3, 6),
+    (1, 2, 2),
+    (2, 4, 4),
+    (2, 5, 2),
+    (2, 3, 7),
+    (3, 4, -1),
+    (4, 5, -2),
+]
+
+
+def test_shortest_paths():
+    assert dag_shortest_paths(6, EDGES, 1) == ([INF, 0, 2, 6, 5, 3], [-1, -1, 1, 1, 3, 4])
+
+
+def test_longest_paths():
+    assert dag_shortest_paths(6, EDGES, 1, longest=True) == (
+        [-INF, 0, 2, 9, 8, 6],
+        [-1, -1, 1, 2, 3, 4],
+    )
+
+
+def test_cycle(capsys):
+    assert dag_shortest_paths(3, [(0, 1, 1), (1, 2, 1), (2, 1, 1)], 0) is None
+    assert critical_path(3, [(0, 1, 1), (1, 2, 1), (2, 1, 1)]) is None
+    assert not capsys.readouterr().out
+
+
+def test_critical_path():
+    assert critical_path(6, EDGES) == (14, [0, 1, 2, 3])
+    assert critical_path(6, CSRGraph.from_edges(6, EDGES)) == (14, [0, 1, 2, 3])
+    assert critical_path(3, [(1, 2, 4)]) == (4, [1, 2])
+    assert critical_path(2, []) == (0, [0])
+    assert critical_path(0, []) == (0, [])
+
+
+def test_random_dags_match_bellman_ford():
+    rng = random.Random(0)
+    for _ in range(50):
+        n = rng.randint(1, 15)
+        edges = []
+        for _ in range(rng.randint(0, 3 * n)):
+            u, v = sorted(rng.sample(range(n), 2)) if n > 1 else (0, 0)
+            if u != v:
+                edges.append((u, v, rng.randint(-5, 10)))
+        src = rng.randrange(n)
+        result = dag_shortest_paths(n, edges, src)
+        assert result is not None
+        assert result[0] == bellman_ford_opti(n, edges, src)[0]
@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from data_structures_and_algorithms.delta_stepping import (
+    default_delta,
+    delta_stepping,
+    delta_stepping_all,
+)
+from data_structures_and_algorithms.dijkstra import INF, dijkstra_all
+from data_structures_and_algorithms.graph import CSRGraph
+
+
+def assert_valid_tree(n, edges, src, dist, prev):
+    assert dist == dijkstra_all(n, edges, src)[0]
+    weights = {}
+    for u, v, w in edges:
+        weights[u, v] = min(w, weights.get((u, v), INF))
+    for node, pred in enumerate(prev):
+        if pred != -1:
+            assert dist[pred] + weights[pred, node] == dist[node]
+
+
+def test_simple_graph():
+    edges = [(0, 1, 1), (0, 2, 4), (1, 2, 2), (2, 3, 1)]
+    assert delta_stepping_all(4, edges, 0, delta=2) == ([0, 1, 3, 4], [-1, 0, 1, 2])
+    assert delta_stepping(4, edges, 0, 3) == [0, 1, 2, 3]
+    assert delta_stepping(4, edges, 3, 0) is None
+    assert delta_stepping(0, [], 0, 0) is None
+
+
+def test_negative_weights():
+    with pytest.raises(ValueError, match="negative"):
+        delta_stepping_all(2, [(0, 1, -1)], 0)
+
+
+def test_default_delta():
+    assert default_delta(CSRGraph.from_edges(2, [(0, 1, 8), (1, 0, 2)])) == 8
+    assert default_delta(CSRGraph.from_edges(2, [(0, 1, 8)] * 4)) == 4
+    assert default_delta(CSRGraph.from_edges(2, [])) == 1
+
+
+@pytest.mark.parametrize("delta", [None, 0.5, 3, 100])
+def test_random_graphs_match_dijkstra(delta):
+    rng = random.Random(0)
+    for _ in range(30):
+        n = rng.randint(1, 30)
+        edges = [(rng.randrange(n), rng.randrange(n), rng.randint(0, 10)) for _ in range(3 * n)]
+        src = rng.randrange(n)
+        assert_valid_tree(n, edges, src, *delta_stepping_all(n, edges, src, delta=delta))
+
+
+def test_parallel_shards():
+    rng = random.Random(1)
+    n = 300
+    edges = [(rng.randrange(n), rng.randrange(n), rng.uniform(0, 1)) for _ in range(3000)]
+    dist, prev = delta_stepping_all(n, edges, 0, max_workers=2, shard_size=8)
+    assert_valid_tree(n, edges, 0, dist, prev)
@@ -1,4 +1,20 @@
-from data_structures_and_algorithms.dijkstra import dijkstra
+import random
+from itertools import pairwise
+
+import pytest
+
+from data_structures_and_algorithms.dijkstra import (
+    DIAL_MAX_WEIGHT,
+    INF,
+    bidirectional_dijkstra,
+    dijkstra,
+    dijkstra_all,
+    dijkstra_implicit,
+    dijkstra_implicit_all,
+    reconstruct_path,
+    select_queue,
+)
+from data_structures_and_algorithms.graph import CSRGraph
 
 
 # Test case 1: Basic case with a simple graph
@@ -62,3 +78,208 @@ def test_source_equals_destination():
     edges = [(0, 1, 1), (1, 2, 1)]
     result = dijkstra(3, edges, 0, 0)
     assert result == [0], f"Expected [0], but got {result}"
+
+
+# Test case 10: One-to-all shortest path tree
+def test_all_shortest_path_tree():
+    edges = [(0, 1, 2), (1, 2, 2), (0, 2, 5), (1, 3, 1), (2, 3, 3)]
+    dist, prev = dijkstra_all(5, edges, 0)
+    assert dist == [0, 2, 4, 3, INF]
+    assert prev == [-1, 0, 1, 1, -1]
+    assert reconstruct_path(prev, 2) == [0, 1, 2]
+    assert reconstruct_path(prev, 3) == [0, 1, 3]
+
+
+# Test case 11: One-to-many stops once the targets are settled
+def test_all_stops_at_targets():
+    edges = [(i, i + 1, 1) for i in range(9)]
+    dist, prev = dijkstra_all(10, edges, 0, targets=[2, 4])
+    assert reconstruct_path(prev, 2) == [0, 1, 2]
+    assert reconstruct_path(prev, 4) == [0, 1, 2, 3, 4]
+    assert dist[4] == 4
+    assert dist[9] == INF  # Never reached
+
+
+# Test case 12: One-to-many with an unreachable target
+def test_all_unreachable_target():
+    edges = [(0, 1, 1), (2, 3, 1)]
+    dist, _ = dijkstra_all(4, edges, 0, targets=[1, 3])
+    assert dist[1] == 1
+    assert dist[3] == INF
+
+
+def _path_length(edges, path):
+    weights = {}
+    for u, v, w in edges:
+        weights[u, v] = min(w, weights.get((u, v), INF))
+    return sum(weights[u, v] for u, v in pairwise(path))
+
+
+# Test case 13: Bidirectional search on the simple cases
+@pytest.mark.parametrize(
+    ("n", "edges", "src", "dest", "expected"),
+    [
+        (3, [(0, 1, 1), (1, 2, 2), (0, 2, 4)], 0, 2, [0, 1, 2]),
+        (4, [(0, 1, 1), (2, 3, 1)], 0, 3, None),
+        (4, [(0, 1, 2), (1, 2, 2), (0, 2, 5), (1, 3, 1), (2, 3, 3)], 0, 3, [0, 1, 3]),
+        (1, [], 0, 0, [0]),
+        (0, [], 0, 0, None),
+        (3, [(0, 1, 1), (1, 2, 1)], 0, 0, [0]),
+        (100, [(i, i + 1, 1) for i in range(99)], 0, 99, list(range(100))),
+    ],
+)
+def test_bidirectional(n, edges, src, dest, expected):
+    assert bidirectional_dijkstra(n, edges, src, dest) == expected
+
+
+# Test case 14: Bidirectional search matches dijkstra on random graphs
+def test_bidirectional_random_graphs():
+    rng = random.Random(0)
+    for _ in range(50):
+        n = rng.randint(2, 30)
+        edges = [
+            (rng.randrange(n), rng.randrange(n), rng.randint(0, 10))
+            for _ in range(rng.randint(0, 4 * n))
+        ]
+        src, dest = rng.randrange(n), rng.randrange(n)
+        expected = dijkstra(n, edges, src, dest)
+        result = bidirectional_dijkstra(n, edges, src, dest)
+        if expected is None:
+            assert result is None
+        else:
+            assert result is not None
+            assert result[0] == src
+            assert result[-1] == dest
+            assert _path_length(edges, result) == _path_length(edges, expected)
+
+
+# Test case 15: Indexed heap gives the same results as heapq
+@pytest.mark.parametrize("queue", ["heap", "indexed"])
+def test_queues_random_graphs(queue):
+    rng = random.Random(1)
+    for _ in range(50):
+        n = rng.randint(1, 30)
+        edges = [
+            (rng.randrange(n), rng.randrange(n), rng.uniform(0, 10))
+            for _ in range(rng.randint(0, 4 * n))
+        ]
+        src = rng.randrange(n)
+        expected = dijkstra_all(n, edges, src)
+        assert dijkstra_all(n, edges, src, queue=queue) == expected
+        assert dijkstra(n, edges, src, n - 1, queue=queue) == dijkstra(n, edges, src, n - 1)
+
+
+# Test case 16: Bucket queues on integer weights
+@pytest.mark.parametrize(
+    ("queue", "max_weight"),
+    [
+        ("heap", 1000),
+        ("indexed", 1000),
+        ("dial", 5),
+        ("dial", 1),
+        ("radix", 1000),
+        ("radix", 3),
+        ("01bfs", 1),
+        ("auto", 1),
+        ("auto", 5),
+        ("auto", 1000),
+    ],
+)
+def test_integer_queues_random_graphs(queue, max_weight):
+    rng = random.Random(2)
+    for _ in range(50):
+        n = rng.randint(1, 30)
+        edges = [
+            (rng.randrange(n), rng.randrange(n), rng.randint(0, max_weight))
+            for _ in range(rng.randint(0, 4 * n))
+        ]
+        src = rng.randrange(n)
+        expected_dist, _ = dijkstra_all(n, edges, src, queue="heap")
+        dist, prev = dijkstra_all(n, edges, src, queue=queue)
+        assert dist == expected_dist
+        for node in range(n):
+            if dist[node] != INF:
+                path = reconstruct_path(prev, node)
+                assert path[0] == src
+                assert _path_length(edges, path) == dist[node]
+
+
+# Test case 17: Automatic queue selection
+@pytest.mark.parametrize(
+    ("weights", "expected"),
+    [
+        ([], "heap"),
+        ([0, 1, 1], "01bfs"),
+        ([0, 2, 2, 1], "dial"),
+        ([DIAL_MAX_WEIGHT] * 2 * DIAL_MAX_WEIGHT, "dial"),
+        ([0, 2, 3], "radix"),  # Sparse: V * C > E
+        ([DIAL_MAX_WEIGHT + 1] * 2 * (DIAL_MAX_WEIGHT + 1), "radix"),
+        ([1, 2.5], "heap"),
+        ([1.0, 2.0], "heap"),
+    ],
+)
+def test_select_queue(weights, expected):
+    graph = CSRGraph.from_edges(2, [(0, 1, w) for w in weights])
+    assert select_queue(graph) == expected
+
+
+def test_long_path_avoids_dial():
+    n = 1000
+    graph = CSRGraph.from_edges(n, [(u, u + 1, DIAL_MAX_WEIGHT) for u in range(n - 1)])
+    assert select_queue(graph) == "radix"
+    assert dijkstra(n, graph, 0, n - 1) == list(range(n))
+
+
+def _grid_neighbors(size, walls):
+    def neighbors(cell):
+        x, y = cell
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < size and 0 <= ny < size and (nx, ny) not in walls:
+                yield (nx, ny), 1 + (nx + ny) % 3
+
+    return neighbors
+
+
+def test_implicit_grid_matches_dijkstra():
+    size = 8
+    rng = random.Random(0)
+    walls = {(rng.randrange(size), rng.randrange(size)) for _ in range(10)} - {(0, 0)}
+    neighbors = _grid_neighbors(size, walls)
+    edges = [
+        (x * size + y, nx * size + ny, w)
+        for x in range(size)
+        for y in range(size)
+        for (nx, ny), w in neighbors((x, y))
+    ]
+
+    dist, prev = dijkstra_implicit_all((0, 0), neighbors)
+    expected_dist, _ = dijkstra_all(size * size, edges, 0)
+    for (x, y), d in dist.items():
+        assert d == expected_dist[x * size + y]
+    assert len(dist) == sum(d != INF for d in expected_dist)
+    assert (0, 0) not in prev
+
+    for dest in dist:
+        path = dijkstra_implicit((0, 0), dest, neighbors)
+        assert path is not None
+        assert path[0] == (0, 0)
+        assert path[-1] == dest
+        length = sum(dict(neighbors(u))[v] for u, v in pairwise(path))
+        assert length == dist[dest]
+
+
+def test_implicit_unbounded_graph():
+    # Infinite line of integers: only the explored region is stored
+    def neighbors(node):
+        return [(node - 1, 1), (node + 1, 1), (node * 2, 1)]
+
+    assert dijkstra_implicit(1, 12, neighbors) == [1, 2, 3, 6, 12]
+    dist, _ = dijkstra_implicit_all(1, neighbors, targets=(12,))
+    assert dist[12] == 4
+    assert len(dist) < 100
+
+
+def test_implicit_no_path():
+    graph = {"a": [("b", 1)], "b": [], "c": [("a", 1)]}
+    assert dijkstra_implicit("a", "c", lambda node: graph[node]) is None
+    assert dijkstra_implicit("a", "a", lambda node: graph[node]) == ["a"]
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from data_structures_and_algorithms.dijkstra import INF, dijkstra_all
+from data_structures_and_algorithms.dynamic_sssp import DynamicSSSP
+
+
+def assert_consistent(sssp):
+    edges = [(u, v, w) for u in range(sssp.n) for v, w in sssp.out[u].items()]
+    assert sssp.dist == dijkstra_all(sssp.n, edges, sssp.src)[0]
+    for node, pred in enumerate(sssp.prev):
+        if pred != -1:
+            assert sssp.dist[pred] + sssp.out[pred][node] == sssp.dist[node]
+
+
+def test_initial_tree():
+    sssp = DynamicSSSP(4, [(0, 1, 1), (0, 2, 4), (1, 2, 2), (2, 3, 1)], 0)
+    assert sssp.dist == [0, 1, 3, 4]
+    assert sssp.path(3) == [0, 1, 2, 3]
+
+
+def test_decrease_and_add():
+    sssp = DynamicSSSP(4, [(0, 1, 1), (0, 2, 4), (1, 2, 2), (2, 3, 1)], 0)
+    sssp.decrease_weight(0, 2, 1)
+    assert sssp.dist == [0, 1, 1, 2]
+    assert sssp.path(3) == [0, 2, 3]
+    sssp.add_edge(1, 3, 0)
+    assert sssp.dist == [0, 1, 1, 1]
+    assert sssp.path(3) == [0, 1, 3]
+
+
+def test_increase_and_remove():
+    sssp = DynamicSSSP(4, [(0, 1, 1), (0, 2, 4), (1, 2, 2), (2, 3, 1)], 0)
+    sssp.increase_weight(1, 2, 5)
+    assert sssp.dist == [0, 1, 4, 5]
+    assert sssp.path(3) == [0, 2, 3]
+    sssp.remove_edge(0, 2)
+    assert sssp.dist == [0, 1, 6, 7]
+    sssp.remove_edge(1, 2)
+    assert sssp.dist == [0, 1, INF, INF]
+    assert sssp.prev == [-1, 0, -1, -1]
+    assert sssp.path(3) is None
+
+
+def test_invalid_updates():
+    sssp = DynamicSSSP(2, [(0, 1, 2)], 0)
+    with pytest.raises(ValueError, match="already exists"):
+        sssp.add_edge(0, 1, 1)
+    with pytest.raises(ValueError, match="doesn't exist"):
+        sssp.remove_edge(1, 0)
+    with pytest.raises(ValueError, match="higher"):
+        sssp.decrease_weight(0, 1, 3)
+    with pytest.raises(ValueError, match="lower"):
+        sssp.increase_weight(0, 1, 1)
+    with pytest.raises(ValueError, match="Negative weight"):
+        sssp.decrease_weight(0, 1, -1)
+
+
+def test_random_updates_match_dijkstra():
+    rng = random.Random(0)
+    for _ in range(20):
+        n = rng.randint(2, 15)
+        edges = [(rng.randrange(n), rng.randrange(n), rng.randint(0, 10)) for _ in range(2 * n)]
+        sssp = DynamicSSSP(n, edges, 0)
+        assert_consistent(sssp)
+        for _ in range(30):
+            u, v = rng.randrange(n), rng.randrange(n)
+            if v not in sssp.out[u]:
+                sssp.add_edge(u, v, rng.randint(0, 10))
+            else:
+                w = int(sssp.out[u][v])
+                match rng.randrange(3):
+                    case 0:
+                        sssp.remove_edge(u, v)
+                    case 1:
+                        sssp.decrease_weight(u, v, rng.randint(0, w))
+                    case _:
+                        sssp.increase_weight(u, v, rng.randint(w, 15))
+            assert_consistent(sssp)
@@ -0,0 +1,76 @@
+import random
+import re
+
+import pytest
+
+from data_structures_and_algorithms.dynamic_topological_order import DynamicTopologicalOrder
+from data_structures_and_algorithms.khan import khan_layers
+
+
+def assert_valid(topo):
+    order = topo.order
+    assert sorted(order) == list(range(len(order)))
+    for node, position in enumerate(topo.ord):
+        assert order[position] == node
+    for u, targets in enumerate(topo.out):
+        for v in targets:
+            assert topo.ord[u] < topo.ord[v]
+
+
+def test_initial_order():
+    topo = DynamicTopologicalOrder(4, [(2, 1), (1, 0)])
+    assert topo.order == [2, 3, 1, 0]
+    assert_valid(topo)
+
+
+def test_add_edge_reorders_affected_region():
+    topo = DynamicTopologicalOrder(5)
+    assert topo.order == [0, 1, 2, 3, 4]
+    topo.add_edge(3, 1)
+    assert_valid(topo)
+    assert topo.order == [0, 3, 2, 1, 4]
+    topo.add_edge(4, 0)
+    assert_valid(topo)
+    assert topo.order == [4, 3, 2, 1, 0]
+
+
+def test_reject_cycles():
+    topo = DynamicTopologicalOrder(3, [(0, 1), (1, 2)])
+    with pytest.raises(ValueError, match="cycle"):
+        topo.add_edge(2, 0)
+    with pytest.raises(ValueError, match="self loop"):
+        topo.add_edge(1, 1)
+    # Rejected edges leave the structure unchanged
+    assert topo.order == [0, 1, 2]
+    assert topo.out == [{1}, {2}, set()]
+
+    topo.remove_edge(1, 2)
+    topo.add_edge(2, 0)
+    assert_valid(topo)
+
+    with pytest.raises(ValueError, match="cycle"):
+        DynamicTopologicalOrder(2, [(0, 1), (1, 0)])
+
+
+def test_random_insertions_match_khan():
+    rng = random.Random(0)
+    for _ in range(20):
+        n = rng.randint(2, 20)
+        topo = DynamicTopologicalOrder(n)
+        edges = set()
+        for _ in range(4 * n):
+            u, v = rng.randrange(n), rng.randrange(n)
+            if rng.random() < 0.2 and edges:
+                edge = rng.choice(sorted(edges))
+                topo.remove_edge(*edge)
+                edges.discard(edge)
+                continue
+            creates_cycle = u == v or khan_layers(n, [*edges, (u, v)]) is None
+            if creates_cycle:
+                reason = "is a self loop" if u == v else "would create a cycle"
+                with pytest.raises(ValueError, match=re.escape(f"Edge ({u}, {v}) {reason}")):
+                    topo.add_edge(u, v)
+            else:
+                topo.add_edge(u, v)
+                edges.add((u, v))
+            assert_valid(topo)
@@ -0,0 +1,90 @@
+import heapq
+import random
+
+import pytest
+
+from data_structures_and_algorithms import external_kruskal as external_kruskal_module
+from data_structures_and_algorithms.external_kruskal import (
+    EDGE_RECORD,
+    external_kruskal,
+    read_edge_file,
+    write_edge_file,
+)
+from data_structures_and_algorithms.kruskal import kruskal
+
+
+def total_weight(edges):
+    return sum(w for _, _, w in edges)
+
+
+def test_edge_file_round_trip(tmp_path):
+    path = tmp_path / "edges.bin"
+    edges = [(i, i + 1, i / 3) for i in range(10_000)]
+    write_edge_file(path, edges)
+    assert path.stat().st_size == len(edges) * EDGE_RECORD.size
+    assert list(read_edge_file(path, buffer_size=7)) == edges
+
+
+def test_truncated_file(tmp_path):
+    path = tmp_path / "edges.bin"
+    path.write_bytes(bytes(EDGE_RECORD.size + 1))
+    with pytest.raises(ValueError, match="Truncated"):
+        list(read_edge_file(path))
+
+
+def test_triangle(tmp_path):
+    path = tmp_path / "edges.bin"
+    write_edge_file(path, [(0, 1, 1.0), (1, 2, 1.0), (0, 2, 0.5)])
+    assert external_kruskal(3, path) == [(0, 2, 0.5), (0, 1, 1.0)]
+
+
+def test_empty_graph(tmp_path):
+    path = tmp_path / "edges.bin"
+    write_edge_file(path, [])
+    assert external_kruskal(0, path) == []
+    assert external_kruskal(3, path) == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_random_graphs_match_kruskal(tmp_path, chunk_size):
+    rng = random.Random(0)
+    for i in range(10):
+        n = rng.randint(1, 50)
+        edges = [(rng.randrange(n), rng.randrange(n), rng.uniform(0, 10)) for _ in range(4 * n)]
+        path = tmp_path / f"edges_{i}.bin"
+        write_edge_file(path, edges)
+
+        mst = external_kruskal(n, path, chunk_size=chunk_size, buffer_size=3, tmp_dir=tmp_path)
+        expected = kruskal(n, list(edges))
+        assert len(mst) == len(expected)
+        assert total_weight(mst) == pytest.approx(total_weight(expected))
+
+
+def test_multi_pass_merge(tmp_path, monkeypatch):
+    rng = random.Random(1)
+    n = 40
+    edges = [(rng.randrange(n), rng.randrange(n), rng.uniform(0, 10)) for _ in range(200)]
+    path = tmp_path / "edges.bin"
+    write_edge_file(path, edges)
+
+    # Record the number of runs of each merge
+    fan_ins = []
+
+    def counting_merge(*iterables, key):
+        fan_ins.append(len(iterables))
+        return heapq.merge(*iterables, key=key)
+
+    monkeypatch.setattr(external_kruskal_module, "merge", counting_merge)
+
+    # 200 runs merged 3 at a time: 67, 23, 8 and 3 runs, then the final merge
+    mst = external_kruskal(n, path, chunk_size=1, merge_fan_in=3, tmp_dir=tmp_path)
+    assert total_weight(mst) == pytest.approx(total_weight(kruskal(n, list(edges))))
+    assert max(fan_ins) == 3
+    assert len(fan_ins) == 67 + 23 + 8 + 3 + 1
+
+
+def test_invalid_merge_fan_in(tmp_path):
+    path = tmp_path / "edges.bin"
+    write_edge_file(path, [(0, 1, 1.0)])
+    with pytest.raises(ValueError, match="merge_fan_in"):
+        external_kruskal(2, path, merge_fan_in=1)
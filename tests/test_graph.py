@@ -0,0 +1,85 @@
+import pytest
+
+from data_structures_and_algorithms.bellman_ford import bellman_ford_opti
+from data_structures_and_algorithms.dijkstra import dijkstra
+from data_structures_and_algorithms.graph import CSRGraph, as_csr
+from data_structures_and_algorithms.khan import khan_bfs, khan_dfs
+from data_structures_and_algorithms.kruskal import kruskal
+
+
+def test_from_edges_layout():
+    graph = CSRGraph.from_edges(4, [(2, 0, 5), (0, 1, 1), (0, 2, 4), (1, 2, 2)])
+    assert list(graph.offsets) == [0, 2, 3, 4, 4]
+    assert list(graph.targets) == [1, 2, 2, 0]
+    assert list(graph.weights) == [1, 4, 2, 5]
+    assert list(graph.sources) == [0, 0, 1, 2]
+    assert graph.num_edges == 4
+
+
+def test_weights_typecode():
+    assert CSRGraph.from_edges(2, [(0, 1, 3)]).weight_typecode == "q"
+    assert CSRGraph.from_edges(2, [(0, 1, 3), (1, 0, 0.5)]).weight_typecode == "d"
+
+
+def test_unweighted_edges():
+    graph = CSRGraph.from_edges(3, [(0, 1), (1, 2)])
+    assert list(graph) == [(0, 1, 1), (1, 2, 1)]
+
+
+def test_neighbors_and_iteration():
+    edges = [(0, 1, 1.5), (0, 2, 2.0), (2, 1, 0.5)]
+    graph = CSRGraph.from_edges(3, edges)
+    assert list(graph.neighbors(0)) == [(1, 1.5), (2, 2.0)]
+    assert list(graph.neighbors(1)) == []
+    assert list(graph) == edges
+
+
+def test_reverse():
+    graph = CSRGraph.from_edges(3, [(0, 1, 1), (0, 2, 2), (2, 1, 3)])
+    assert sorted(graph.reverse()) == [(1, 0, 1), (1, 2, 3), (2, 0, 2)]
+
+
+def test_empty_graph():
+    graph = CSRGraph.from_edges(0, [])
+    assert list(graph.offsets) == [0]
+    assert list(graph) == []
+
+
+def test_as_csr():
+    graph = CSRGraph.from_edges(2, [(0, 1, 1)])
+    assert as_csr(2, graph) is graph
+    with pytest.raises(ValueError, match="expected 3"):
+        as_csr(3, graph)
+
+
+def test_graph_reused_by_algorithms():
+    edges = [(0, 1, 2), (1, 2, 2), (0, 2, 5), (1, 3, 1), (2, 3, 3)]
+    graph = CSRGraph.from_edges(4, edges)
+
+    assert dijkstra(4, graph, 0, 3) == [0, 1, 3]
+    assert dijkstra(4, graph, 0, 2) == [0, 1, 2]
+    assert bellman_ford_opti(4, graph, 0) == ([0, 2, 4, 3], [-1, 0, 1, 1])
+    assert khan_dfs(4, graph) == khan_dfs(4, [(u, v) for u, v, _ in edges])
+    assert khan_bfs(4, graph) == khan_bfs(4, [(u, v) for u, v, _ in edges])
+    assert sum(w for _, _, w in kruskal(4, graph)) == 5
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+@pytest.mark.parametrize("weight", [2, 2.5])
+def test_save_and_load(tmp_path, use_mmap, weight):
+    graph = CSRGraph.from_edges(4, [(2, 0, weight), (0, 1, 1), (0, 2, 4), (1, 2, 2)])
+    path = tmp_path / "graph.csr"
+    graph.save(path)
+
+    loaded = CSRGraph.load(path, use_mmap=use_mmap)
+    assert loaded.n == 4
+    assert loaded.weight_typecode == graph.weight_typecode
+    assert list(loaded) == list(graph)
+    assert dijkstra(4, loaded, 0, 2) == dijkstra(4, graph, 0, 2)
+
+
+def test_load_invalid_file(tmp_path):
+    path = tmp_path / "graph.csr"
+    path.write_bytes(bytes(64))
+    with pytest.raises(ValueError, match="not a CSR graph"):
+        CSRGraph.load(path)
@@ -0,0 +1,66 @@
+import random
+
+from data_structures_and_algorithms.bellman_ford import bellman_ford_opti
+from data_structures_and_algorithms.dijkstra import INF, reconstruct_path
+from data_structures_and_algorithms.graph import CSRGraph
+from data_structures_and_algorithms.johnson import johnson
+
+
+def test_negative_edges():
+    edges = [(0, 1, 3), (0, 2, 8), (1, 2, -4), (2, 3, 2), (3, 0, 1)]
+    result = johnson(4, edges)
+    assert result[0] is not None
+    dist, prev = result
+    assert dist == [[0, 3, -1, 1], [-1, 0, -4, -2], [3, 6, 0, 2], [1, 4, 0, 0]]
+    assert reconstruct_path(prev[0], 3) == [0, 1, 2, 3]
+    assert reconstruct_path(prev[3], 2) == [3, 0, 1, 2]
+
+
+def test_unreachable():
+    dist, prev = johnson(3, [(0, 1, -2)])
+    assert dist == [[0, -2, INF], [INF, 0, INF], [INF, INF, 0]]
+    assert prev[0] == [-1, 0, -1]
+
+
+def test_negative_cycle():
+    edges = [(0, 1, 1), (1, 2, -1), (2, 3, -1), (3, 1, 1)]
+    dist, cycle = johnson(4, edges)
+    assert dist is None
+    assert set(cycle) == {1, 2, 3}
+
+
+def test_csr_input_and_empty_graph():
+    graph = CSRGraph.from_edges(2, [(0, 1, -1.5)])
+    assert johnson(2, graph) == ([[0, -1.5], [INF, 0]], [[-1, 0], [-1, -1]])
+    assert johnson(0, []) == ([], [])
+
+
+def test_random_graphs_match_bellman_ford():
+    rng = random.Random(0)
+    for _ in range(30):
+        n = rng.randint(1, 12)
+        # Non-negative cycles: weights derived from potentials, plus a non-negative slack
+        h = [rng.randint(-5, 5) for _ in range(n)]
+        edges = []
+        for _ in range(rng.randint(0, 3 * n)):
+            u, v = rng.randrange(n), rng.randrange(n)
+            edges.append((u, v, h[v] - h[u] + rng.randint(0, 4)))
+        result = johnson(n, edges)
+        assert result[0] is not None
+        dist, prev = result
+        for src in range(n):
+            assert dist[src] == bellman_ford_opti(n, edges, src)[0]
+            for dest in range(n):
+                if dist[src][dest] != INF:
+                    assert reconstruct_path(prev[src], dest)[0] == src
+
+
+def test_parallel_matches_sequential():
+    rng = random.Random(1)
+    n = 30
+    h = [rng.uniform(-5, 5) for _ in range(n)]
+    edges = []
+    for _ in range(90):
+        u, v = rng.randrange(n), rng.randrange(n)
+        edges.append((u, v, round(h[v] - h[u] + rng.uniform(0, 4), 6)))
+    assert johnson(n, edges, max_workers=2) == johnson(n, edges)
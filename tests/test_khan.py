@@ -1,6 +1,6 @@
 import pytest
 
-from data_structures_and_algorithms.khan import khan_bfs, khan_dfs
+from data_structures_and_algorithms.khan import iter_khan_dfs, khan_bfs, khan_dfs, khan_layers
 
 
 # Fixture to provide implementations
@@ -75,3 +75,55 @@ def test_khan_cycle_detection_propagation(khan_func):
     assert result is None, (
         "Cycle detection failed: the function did not return None for a graph with a cycle"
     )
+
+
+def test_khan_layers():
+    edges = [(5, 2), (5, 0), (4, 0), (4, 1), (2, 3), (3, 1)]
+    assert khan_layers(6, edges) == [[4, 5], [2, 0], [3], [1]]
+    assert khan_layers(3, []) == [[0, 1, 2]]
+    assert khan_layers(0, []) == []
+
+
+def test_khan_layers_cycle():
+    assert khan_layers(4, [(0, 1), (1, 2), (2, 3), (3, 1)]) is None
+
+
+def test_khan_layers_are_antichains():
+    edges = [(0, 2), (1, 2), (2, 3), (0, 4), (4, 3), (5, 6)]
+    layers = khan_layers(7, edges)
+    assert layers is not None
+    # Flattened layers are a topological order, and the depth is the longest path
+    order = [node for layer in layers for node in layer]
+    assert all(order.index(u) < order.index(v) for u, v in edges)
+    assert len(layers) == 3
+    layer_of = {node: k for k, layer in enumerate(layers) for node in layer}
+    assert all(layer_of[u] < layer_of[v] for u, v in edges)
+
+
+def test_khan_long_chain(khan_func):
+    # Longer than the recursion limit
+    n = 100_000
+    assert khan_func(n, [(i, i + 1) for i in range(n - 1)]) == list(range(n))
+
+
+def test_khan_dfs_order():
+    # Depth first: the whole subtree of 0 before the next source
+    edges = [(0, 2), (2, 3), (0, 4), (1, 5), (3, 5)]
+    assert khan_dfs(6, edges) == [0, 2, 3, 4, 1, 5]
+
+
+def test_iter_khan_dfs():
+    edges = [(5, 2), (5, 0), (4, 0), (4, 1), (2, 3), (3, 1)]
+    assert list(iter_khan_dfs(6, edges)) == khan_dfs(6, edges)
+
+    # The order is streamed before the sort finishes
+    order = iter_khan_dfs(3, [(0, 1), (1, 2)])
+    assert next(order) == 0
+
+
+def test_iter_khan_dfs_cycle():
+    order = iter_khan_dfs(4, [(0, 1), (1, 2), (2, 1)])
+    assert next(order) == 0
+    assert next(order) == 3
+    with pytest.raises(ValueError, match="cycle"):
+        next(order)
@@ -1,3 +1,8 @@
+import random
+
+import pytest
+
+from data_structures_and_algorithms.graph import CSRGraph
 from data_structures_and_algorithms.kruskal import kruskal
 
 
@@ -121,3 +126,24 @@ def test_spanning_forest():
     # Verify that the isolated node (5) is not connected to any other node
     for edge in mst:
         assert 5 not in edge[:2], "The isolated node (5) should not be connected to any other node."
+
+
+@pytest.mark.parametrize("selection", ["heap", "filter"])
+def test_selection_modes_match_sort(selection):
+    """Test that the lazy edge selection modes give a spanning forest of the same weight."""
+    rng = random.Random(0)
+    for _ in range(30):
+        n = rng.randint(1, 60)
+        # Dense graphs with repeated weights, large enough to be partitioned by "filter"
+        edges: list[tuple[int, int, float]] = [
+            (rng.randrange(n), rng.randrange(n), rng.randint(0, 20))
+            for _ in range(rng.randint(0, 10 * n))
+        ]
+        expected = kruskal(n, list(edges))
+        mst = kruskal(n, list(edges), selection=selection)
+        assert len(mst) == len(expected)
+        assert total_weight(mst) == total_weight(expected)
+        assert set(mst) <= set(edges)
+
+        csr_mst = kruskal(n, CSRGraph.from_edges(n, edges), selection=selection)
+        assert total_weight(csr_mst) == total_weight(expected)
@@ -0,0 +1,109 @@
+import random
+
+import pytest
+
+from data_structures_and_algorithms.graph import CSRGraph
+from data_structures_and_algorithms.kruskal import kruskal
+from data_structures_and_algorithms.mst import minimum_spanning_tree, select_engine
+from data_structures_and_algorithms.prim import AdjacencyMatrix, prim, prim_dense, prim_dense_edges
+
+INF = float("inf")
+
+
+def test_prim_triangle():
+    edges = [(0, 1, 1.0), (1, 2, 1.0), (0, 2, 2.0)]
+    assert prim(3, edges) == [(0, 1, 1.0), (1, 2, 1.0)]
+
+
+def test_prim_dense():
+    matrix = [
+        [INF, 2, INF, 6],
+        [2, INF, 3, 8],
+        [INF, 3, INF, INF],
+        [6, 8, INF, INF],
+    ]
+    assert prim_dense(matrix) == [(0, 1, 2), (1, 2, 3), (0, 3, 6)]
+
+
+def test_prim_dense_edges():
+    edges = [(3, 1, 8), (0, 3, 6), (2, 1, 3), (1, 0, 2), (1, 2, 5)]
+    assert prim_dense_edges(4, edges) == [(1, 0, 2), (2, 1, 3), (0, 3, 6)]
+
+
+def test_input_edges_are_returned():
+    # Orientation, parallel edge and weight type of the input are kept
+    edges = [(1, 0, 2), (0, 1, 2.0), (2, 1, 1), (2, 2, -1)]
+    for engine in (prim, prim_dense_edges):
+        mst = engine(3, edges)
+        assert mst == [(2, 1, 1), (1, 0, 2)]
+        assert type(mst[1][2]) is int
+
+
+def test_forest_and_empty_graph():
+    assert prim(0, []) == []
+    assert prim_dense([]) == []
+    assert prim_dense_edges(0, []) == []
+    assert prim(4, [(0, 1, 1), (3, 2, -1)]) == [(3, 2, -1), (0, 1, 1)]
+    assert prim_dense_edges(4, [(0, 1, 1), (3, 2, -1)]) == [(3, 2, -1), (0, 1, 1)]
+    assert prim_dense([[INF, INF], [INF, INF]]) == []
+    assert prim_dense_edges(2, []) == []
+
+
+def test_select_engine():
+    assert select_engine(AdjacencyMatrix([[INF]])) == "prim_dense"
+    complete = [(u, v, 1) for u in range(10) for v in range(u + 1, 10)]
+    assert select_engine(complete) == "kruskal"
+    assert select_engine(CSRGraph.from_edges(10, complete)) == "kruskal"
+
+
+def test_adjacency_matrix_edges():
+    matrix = AdjacencyMatrix([[0, 1, INF], [1, 0, 2], [INF, 2, 0]])
+    assert matrix.edges() == [(0, 1, 1), (1, 2, 2)]
+
+
+@pytest.mark.parametrize("engine", ["auto", "kruskal", "prim", "prim_dense"])
+def test_random_graphs_match_kruskal(engine):
+    rng = random.Random(0)
+    for _ in range(30):
+        n = rng.randint(1, 30)
+        edges = [
+            (rng.randrange(n), rng.randrange(n), rng.randint(-5, 20))
+            for _ in range(rng.randint(0, n * n))
+        ]
+        expected = kruskal(n, list(edges))
+        assert minimum_spanning_tree(n, list(edges), engine=engine) == expected
+
+        graph = CSRGraph.from_edges(n, edges)
+        assert minimum_spanning_tree(n, graph, engine=engine) == kruskal(n, graph)
+
+
+@pytest.mark.parametrize("engine", ["prim", "prim_dense"])
+def test_mixed_weight_types_match_kruskal(engine):
+    rng = random.Random(1)
+    for _ in range(30):
+        n = rng.randint(1, 15)
+        edges = [
+            (
+                rng.randrange(n),
+                rng.randrange(n),
+                rng.choice([rng.randint(0, 5), rng.randint(0, 5) / 2]),
+            )
+            for _ in range(rng.randint(0, n * n))
+        ]
+        assert minimum_spanning_tree(n, list(edges), engine=engine) == kruskal(n, list(edges))
+
+
+@pytest.mark.parametrize("engine", ["auto", "kruskal", "prim", "prim_dense"])
+def test_matrix_input_matches_kruskal(engine):
+    rng = random.Random(2)
+    for _ in range(30):
+        n = rng.randint(1, 30)
+        # Distinct weights: a unique minimum spanning tree
+        weights = iter(rng.sample(range(-100, 1000), n * n))
+        matrix = [[INF] * n for _ in range(n)]
+        for u in range(n):
+            for v in range(u + 1, n):
+                if rng.random() < 0.8:
+                    matrix[u][v] = matrix[v][u] = next(weights)
+        graph = AdjacencyMatrix(matrix)
+        assert minimum_spanning_tree(n, graph, engine=engine) == kruskal(n, graph.edges())
@@ -0,0 +1,68 @@
+import random
+
+from data_structures_and_algorithms.graph import CSRGraph
+from data_structures_and_algorithms.khan import khan_layers
+from data_structures_and_algorithms.scc import condensation, find_cycles, tarjan_scc
+
+
+def normalize(components):
+    return sorted(sorted(component) for component in components)
+
+
+def test_tarjan_scc():
+    edges = [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 3), (5, 4)]
+    components = tarjan_scc(6, edges)
+    assert normalize(components) == [[0, 1, 2], [3, 4], [5]]
+    # Reverse topological order: {3, 4} is reachable from the others
+    assert sorted(components[0]) == [3, 4]
+
+
+def test_dag_components_are_single_nodes():
+    assert normalize(tarjan_scc(3, [(0, 1), (1, 2)])) == [[0], [1], [2]]
+    assert tarjan_scc(0, []) == []
+
+
+def test_condensation():
+    edges = [(0, 1), (1, 0), (1, 2), (2, 3), (3, 2), (0, 3), (4, 4)]
+    result = condensation(5, CSRGraph.from_edges(5, edges))
+    assert normalize(result.components) == [[0, 1], [2, 3], [4]]
+    a, b = result.component_of[0], result.component_of[2]
+    assert result.component_of[1] == a
+    assert result.component_of[3] == b
+    assert result.edges == [(a, b)]
+    assert result.order.index(a) < result.order.index(b)
+
+
+def test_find_cycles():
+    edges = [(0, 1), (1, 2), (2, 0), (3, 3), (4, 5)]
+    assert normalize(find_cycles(6, edges)) == [[0, 1, 2], [3]]
+    assert find_cycles(3, [(0, 1), (1, 2)]) == []
+
+
+def test_long_chain_no_recursion_limit():
+    n = 100_000
+    edges = [(i, i + 1) for i in range(n - 1)] + [(n - 1, 0)]
+    assert len(tarjan_scc(n, edges)) == 1
+
+
+def test_random_graphs():
+    rng = random.Random(0)
+    for _ in range(50):
+        n = rng.randint(1, 20)
+        edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(rng.randint(0, 2 * n))]
+        result = condensation(n, edges)
+
+        # Same SCC iff mutually reachable
+        reach = [{u} for u in range(n)]
+        for _ in range(n):
+            for u, v in edges:
+                reach[u] |= reach[v]
+        for u in range(n):
+            for v in range(n):
+                same = result.component_of[u] == result.component_of[v]
+                assert same == (v in reach[u] and u in reach[v])
+
+        # The condensation is a DAG and order is a topological order of it
+        assert khan_layers(len(result.components), result.edges) is not None
+        position = {c: i for i, c in enumerate(result.order)}
+        assert all(position[a] < position[b] for a, b in result.edges)
@@ -0,0 +1,71 @@
+import itertools
+import random
+
+from data_structures_and_algorithms.yen import KShortestPaths, k_shortest_paths
+
+# Classic example from the Wikipedia article on Yen's algorithm (C=0, D=1, E=2, F=3, G=4, H=5)
+EDGES = [
+    (0, 1, 3),
+    (0, 2, 2),
+    (1, 3, 4),
+    (2, 1, 1),
+    (2, 3, 2),
+    (2, 4, 3),
+    (3, 4, 2),
+    (3, 5, 1),
+    (4, 5, 2),
+]
+
+
+def test_wikipedia_example():
+    assert KShortestPaths(6, EDGES, 0, 5).k_shortest(3) == [
+        (5, [0, 2, 3, 5]),
+        (7, [0, 2, 4, 5]),
+        (8, [0, 1, 3, 5]),
+    ]
+
+
+def test_resume():
+    paths = KShortestPaths(6, EDGES, 0, 5)
+    first = paths.k_shortest(2)
+    assert len(paths.paths) == 2
+    assert paths.k_shortest(4)[:2] == first
+    assert len(paths.paths) == 4
+    assert paths.k_shortest(1) == first[:1]
+
+
+def test_fewer_paths_than_k():
+    assert k_shortest_paths(3, [(0, 1, 1), (1, 2, 1), (0, 2, 3)], 0, 2, 5) == [[0, 1, 2], [0, 2]]
+    assert k_shortest_paths(3, [(0, 1, 1)], 0, 2, 2) == []
+    assert k_shortest_paths(2, [(0, 1, 1)], 0, 0, 2) == [[0]]
+
+
+def test_iteration():
+    lengths = [length for length, _ in KShortestPaths(6, EDGES, 0, 5)]
+    assert lengths == sorted(lengths)
+    assert len(lengths) == 7
+
+
+def _all_simple_paths(n, edges, src, dest):
+    weights = {}
+    for u, v, w in edges:
+        weights[u, v] = min(w, weights.get((u, v), float("inf")))
+    paths = []
+    inner = [node for node in range(n) if node not in {src, dest}]
+    for size in range(len(inner) + 1):
+        for middle in itertools.permutations(inner, size):
+            path = [src, *middle, dest]
+            pairs = list(itertools.pairwise(path))
+            if all(pair in weights for pair in pairs):
+                paths.append(sum(weights[pair] for pair in pairs))
+    return sorted(paths)
+
+
+def test_random_graphs_match_brute_force():
+    rng = random.Random(0)
+    for _ in range(30):
+        n = rng.randint(2, 6)
+        edges = [(rng.randrange(n), rng.randrange(n), rng.randint(1, 9)) for _ in range(3 * n)]
+        expected = _all_simple_paths(n, edges, 0, n - 1)
+        lengths = [length for length, _ in KShortestPaths(n, edges, 0, n - 1)]
+        assert lengths == expected